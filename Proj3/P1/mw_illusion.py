@@ -34,12 +34,21 @@ def draw_illusion(n, w, cg, cs, f, a, b):
     """
     if f>=0.5:
         f=0.3
+    # all the rectangles, in drawing order, drawn at once by draw_rects
+    xs=[]
+    ys=[]
+    ws=[]
+    cs_all=[]
     for i in range (n-1):    
-        shapes.draw_rect(a,b+2*i,2*(w-2*f*w)/3+f*w,1,cg)
-        shapes.draw_rect(a+2*(w-2*f*w)/3+2*f*w,b+2*i,(w-2*f*w)/3,1,cg)
-        shapes.draw_rect(a+(w-2*f*w)/3,i*2+b+1,f*w,1,cs)
-        shapes.draw_rect(a+2*(w-2*f*w)/3+f*w,b+2*i,f*w,1,cs)
-    shapes.draw_rect(a,b+2*(n-1),w,1,cg)
+        xs+=[a, a+2*(w-2*f*w)/3+2*f*w, a+(w-2*f*w)/3, a+2*(w-2*f*w)/3+f*w]
+        ys+=[b+2*i, b+2*i, i*2+b+1, b+2*i]
+        ws+=[2*(w-2*f*w)/3+f*w, (w-2*f*w)/3, f*w, f*w]
+        cs_all+=[cg, cg, cs, cs]
+    xs.append(a)
+    ys.append(b+2*(n-1))
+    ws.append(w)
+    cs_all.append(cg)
+    shapes.draw_rects(xs,ys,ws,1,cs_all)
     return None
 #----
 # Demonstration: draw three different Munker-White Illusions where the left 
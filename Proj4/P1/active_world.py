@@ -0,0 +1,164 @@
+# active_world.py
+"""
+Game of Life world with active-region tracking for Project 4
+
+The world is split into TILE-by-TILE tiles.  A tile is recomputed only if a
+cell in it or in one of its 8 neighboring tiles changed in the previous
+generation, because a cell whose neighborhood did not change keeps its state.
+For patterns such as a glider or a gun on a big board, the cost of a
+generation then grows with the activity of the pattern, not with the area of
+the board.  The result is exactly the same as the full recompute.
+"""
+import numpy as np
+import random
+from life_rules import count_neighbors, apply_rules
+
+TILE = 32  # side length of a tile, in cells
+
+
+def _dilate(tiles):
+    """
+    Returns a copy of the 2-d bool array tiles where every tile next to a
+    True tile (in any of the 8 directions) is also True
+    """
+    out = tiles.copy()
+    out[1:, :] |= tiles[:-1, :]
+    out[:-1, :] |= tiles[1:, :]
+    grown = out.copy()
+    out[:, 1:] |= grown[:, :-1]
+    out[:, :-1] |= grown[:, 1:]
+    return out
+
+
+class ActiveWorld:
+    """
+    An ActiveWorld is an nr-by-nc Game of Life world that remembers which of
+    its tiles may change in the next generation.
+
+    Attributes
+    ----------
+    nr : int
+        number of rows of the world
+    nc : int
+        number of columns of the world
+    cells : 2-d float array
+        the world matrix, padded with dead cells: a border of one cell all
+        around, and extra rows and columns at the end so that the world is a
+        whole number of tiles.  Cell [i,j] of the world is cells[i+1, j+1].
+    active : 2-d bool array
+        active[p,q] is True if tile [p,q] (cells [p*TILE:(p+1)*TILE,
+        q*TILE:(q+1)*TILE] of the world) must be recomputed
+    """
+
+    def __init__(self, nr, nc):
+        """
+        Initializes an all-dead ActiveWorld object with all tiles active
+
+        Parameters
+        ----------
+        nr : number of rows, a positive int
+
+        nc : number of columns, a positive int
+        """
+        self.nr = nr
+        self.nc = nc
+        ntr = (nr + TILE - 1)//TILE
+        ntc = (nc + TILE - 1)//TILE
+        self.cells = np.zeros((ntr*TILE + 2, ntc*TILE + 2))
+        self.active = np.ones((ntr, ntc), dtype=bool)
+
+
+    @classmethod
+    def from_array(cls, w):
+        """
+        Returns a new ActiveWorld with the cells of the world matrix w
+
+        Parameter w: the world matrix, a 2-d array of 0s and 1s
+        """
+        nr, nc = np.shape(w)
+        world = cls(nr, nc)
+        world.cells[1:nr + 1, 1:nc + 1] = w
+        return world
+
+
+    def to_array(self):
+        """
+        Returns the world matrix (a 2-d float array of 0s and 1s) of self
+        """
+        return self.cells[1:self.nr + 1, 1:self.nc + 1].copy()
+
+
+    def num_active(self):
+        """
+        Returns (int) the number of tiles that will be recomputed in the next
+        generation
+        """
+        return int(self.active.sum())
+
+
+    def one_generation_later(self, add_rule, rng=None):
+        """
+        Advances self ONE generation in place according to the rules of the
+        game of life (the same rules as game_of_life.one_generation_later)
+        and returns self
+
+        Parameters
+        ----------
+        add_rule : (bool) If True, apply extra-life-rule;
+                   otherwise do not apply extra-life-rule.
+
+        rng : None or a numpy.random.Generator used for the extra-life-rule.
+              If None, random.random() is drawn once per candidate cell in
+              row-major order over the whole world, as one_generation_later
+              does, so both give the same world for the same random.seed.
+        """
+        tile_r, tile_c = np.nonzero(self.active)
+        k = len(tile_r)
+        if k == 0:
+            return self
+        #gather the active tiles with a one-cell halo: shape (k, TILE+2, TILE+2)
+        span = np.arange(TILE + 2)
+        rows = (tile_r*TILE)[:, None] + span
+        cols = (tile_c*TILE)[:, None] + span
+        blocks = self.cells[rows[:, :, None], cols[:, None, :]]
+        old = blocks[:, 1:-1, 1:-1]
+        counts = count_neighbors(blocks == 1)[:, 1:-1, 1:-1]
+        new = apply_rules(old, counts, False)
+
+        #cells of the padding past the last row and column stay dead
+        inside = (rows[:, 1:-1, None] <= self.nr) & \
+                 (cols[:, None, 1:-1] <= self.nc)
+        new[~inside] = 0
+        if add_rule:
+            candidates = (counts > 3) & (old == 0) & inside
+            self._rebirths(new, candidates, rows, cols, rng)
+
+        self.cells[rows[:, 1:-1, None], cols[:, None, 1:-1]] = new
+
+        #tiles that changed, or that still hold extra-life-rule candidates,
+        #make their neighborhood active for the next generation
+        changed = (new != old).any(axis=(1, 2))
+        if add_rule:
+            changed |= candidates.any(axis=(1, 2))
+        self.active[:] = False
+        self.active[tile_r[changed], tile_c[changed]] = True
+        self.active = _dilate(self.active)
+        return self
+
+
+    def _rebirths(self, new, candidates, rows, cols, rng):
+        """
+        Applies the extra-life-rule to the new tiles: each candidate cell
+        comes back to life with probability 0.4.  The draws are made in
+        row-major order over the whole world.
+        """
+        t, i, j = np.nonzero(candidates)
+        #position of each candidate in the world, in row-major order
+        order = np.argsort((rows[t, i + 1] - 1)*self.nc + cols[t, j + 1] - 1,
+                           kind='stable')
+        if rng is None:
+            draws = np.array([random.random() for _ in range(len(order))])
+        else:
+            draws = rng.random(len(order))
+        reborn = order[draws <= 0.4]
+        new[t[reborn], i[reborn], j[reborn]] = 1
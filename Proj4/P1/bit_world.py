@@ -0,0 +1,292 @@
+# bit_world.py
+"""
+Bit-packed Game of Life world for Project 4
+
+A BitWorld stores one bit per cell, 64 cells per uint64 word, instead of one
+float64 per cell, so it uses 64 times less memory than the world matrix of
+create_world.  The next generation is computed for 64 cells at a time with
+bitwise operations: the 8 neighbor bit planes are added with full adders and
+the rules are applied to the resulting count bits.
+"""
+import numpy as np
+import random
+
+ONE = np.uint64(1)
+TOP = np.uint64(63)
+BAND_ROWS = 512  # rows processed together when stepping, bounds memory use
+
+
+def _full_add(a, b, c):
+    """
+    Returns (sum, carry), the bitwise full adder of bit planes a, b and c
+    """
+    t = a ^ b
+    return t ^ c, (a & b) | (t & c)
+
+
+def _half_add(a, b):
+    """
+    Returns (sum, carry), the bitwise half adder of bit planes a and b
+    """
+    return a ^ b, a & b
+
+
+def _west(x):
+    """
+    Returns the bit planes x shifted so that the bit of each cell holds the
+    cell to its left (column - 1).  x is a 2-d array of uint64 words.
+    """
+    out = x << ONE
+    out[:, 1:] |= x[:, :-1] >> TOP
+    return out
+
+
+def _east(x):
+    """
+    Returns the bit planes x shifted so that the bit of each cell holds the
+    cell to its right (column + 1).  x is a 2-d array of uint64 words.
+    """
+    out = x >> ONE
+    out[:, :-1] |= x[:, 1:] << TOP
+    return out
+
+
+def _unpack_words(words):
+    """
+    Returns a (k, 64) array of bools with the bits of a 1-d array of k uint64
+    words, lowest bit first
+    """
+    as_bytes = words.astype('<u8').view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(as_bytes, axis=1, bitorder='little').astype(bool)
+
+
+def pack_rows(block, nw):
+    """
+    Returns a (m, nw) array of uint64 words holding the cells of block
+
+    Parameters
+    ----------
+    block : an m-by-c array of 0s and 1s (c <= 64*nw).  Column j is stored in
+            bit j%64 of word j//64.
+
+    nw : number of words per row
+    """
+    m = np.shape(block)[0]
+    packed = np.zeros((m, nw*8), dtype=np.uint8)
+    row_bytes = np.packbits(np.asarray(block) == 1, axis=1, bitorder='little')
+    packed[:, :row_bytes.shape[1]] = row_bytes
+    return packed.view('<u8').astype(np.uint64)
+
+
+class BitWorld:
+    """
+    A BitWorld is an nr-by-nc Game of Life world with one bit per cell.
+
+    Attributes
+    ----------
+    nr : int
+        number of rows of the world
+    nc : int
+        number of columns of the world
+    words : 2-d array of uint64
+        nr-by-ceil(nc/64) array.  Cell [i,j] is alive if bit j%64 of
+        words[i, j//64] is set.  Bits past column nc-1 are always 0.
+    """
+
+    def __init__(self, nr, nc, words=None):
+        """
+        Initializes a BitWorld object, all dead unless words is given
+
+        Parameters
+        ----------
+        nr : number of rows, a positive int
+
+        nc : number of columns, a positive int
+
+        words : None or an nr-by-ceil(nc/64) array of uint64 words
+        """
+        self.nr = nr
+        self.nc = nc
+        nw = (nc + 63)//64
+        if words is None:
+            words = np.zeros((nr, nw), dtype=np.uint64)
+        self.words = words
+        #mask of the bits of the last word that are inside the world
+        if nc % 64 == 0:
+            self._last_mask = ~np.uint64(0)
+        else:
+            self._last_mask = np.uint64((1 << (nc % 64)) - 1)
+
+
+    @classmethod
+    def from_array(cls, w):
+        """
+        Returns a new BitWorld with the cells of the world matrix w
+
+        Parameter w: the world matrix, a 2-d array of 0s and 1s
+        """
+        nr, nc = np.shape(w)
+        return cls(nr, nc, pack_rows(w, (nc + 63)//64))
+
+
+    @classmethod
+    def from_rows(cls, nr, nc, chunks):
+        """
+        Returns a new nr-by-nc BitWorld built a chunk of rows at a time, so
+        that the world matrix is never in memory all at once
+
+        Parameters
+        ----------
+        nr : number of rows of the world
+
+        nc : number of columns of the world
+
+        chunks : an iterable of tuples (r0, block) where block is a 2-d array
+                 of 0s and 1s holding rows r0, r0+1, ... of the world, e.g.,
+                 game_of_life.random_rows(nr, nc)
+        """
+        world = cls(nr, nc)
+        nw = world.words.shape[1]
+        for r0, block in chunks:
+            world.words[r0:r0 + len(block)] = pack_rows(block, nw)
+        return world
+
+
+    def to_array(self):
+        """
+        Returns the world matrix (a 2-d float array of 0s and 1s) of self
+        """
+        as_bytes = self.words.astype('<u8').view(np.uint8)
+        bits = np.unpackbits(as_bytes, axis=1, bitorder='little')
+        return bits[:, :self.nc].astype(float)
+
+
+    @classmethod
+    def load(cls, filename, nr, nc):
+        """
+        Returns a new nr-by-nc BitWorld read from a seed file
+
+        The file has the format of the seeds_*.txt files: lines of 0s and 1s
+        separated by spaces, and comments starting with '#'.  Only the first
+        nr rows and nc columns are read; a smaller seed is padded with dead
+        cells.  The file is read one line at a time, so the dense world is
+        never built.
+
+        Parameters
+        ----------
+        filename : (string) name of the seed file
+
+        nr : number of rows of the world
+
+        nc : number of columns of the world
+        """
+        world = cls(nr, nc)
+        nw = world.words.shape[1]
+        i = 0
+        with open(filename, 'r') as fid:
+            for line in fid:
+                values = line.split('#')[0].split()
+                if values == []:
+                    continue
+                row = np.array(values[:nc], dtype=np.uint8)
+                world.words[i] = pack_rows(row.reshape(1, -1), nw)[0]
+                i += 1
+                if i == nr:
+                    break
+        return world
+
+
+    def save(self, filename, comment=None):
+        """
+        Writes self to a seed file in the format of the seeds_*.txt files
+
+        Parameters
+        ----------
+        filename : (string) name of the file to write
+
+        comment : None or a string written as a '#' comment line at the top
+        """
+        with open(filename, 'w') as fid:
+            if comment is not None:
+                fid.write(f'# {comment}\n')
+            for r0 in range(0, self.nr, BAND_ROWS):
+                band = BitWorld(min(BAND_ROWS, self.nr - r0), self.nc,
+                                self.words[r0:r0 + BAND_ROWS])
+                np.savetxt(fid, band.to_array(), fmt='%d')
+
+
+    def population(self):
+        """
+        Returns (int) the number of live cells
+        """
+        total = 0
+        for r0 in range(0, self.nr, BAND_ROWS):
+            band = self.words[r0:r0 + BAND_ROWS].astype('<u8')
+            total += int(np.unpackbits(band.view(np.uint8)).sum(dtype=np.int64))
+        return total
+
+
+    def one_generation_later(self, add_rule, rng=None):
+        """
+        Returns a new BitWorld after ONE generation according to the rules of
+        the game of life (the same rules as game_of_life.one_generation_later)
+
+        Parameters
+        ----------
+        add_rule : (bool) If True, apply extra-life-rule;
+                   otherwise do not apply extra-life-rule.
+
+        rng : None or a numpy.random.Generator used for the extra-life-rule.
+              If None, random.random() is drawn once per candidate cell in
+              row-major order, as one_generation_later does.
+        """
+        w = self.words
+        new_words = np.empty_like(w)
+        zero_row = np.zeros((1, w.shape[1]), dtype=np.uint64)
+        for r0 in range(0, self.nr, BAND_ROWS):
+            r1 = min(r0 + BAND_ROWS, self.nr)
+            x = w[r0:r1]
+            #one-row halos above and below the band (dead outside the world)
+            up = np.concatenate((w[r0 - 1:r0] if r0 > 0 else zero_row,
+                                 w[r0:r1 - 1]))
+            down = np.concatenate((w[r0 + 1:r1],
+                                   w[r1:r1 + 1] if r1 < self.nr else zero_row))
+            #add the 8 neighbor bit planes: ones, twos and fours bits
+            s1, c1 = _full_add(_west(up), up, _east(up))
+            s2, c2 = _full_add(_west(x), _east(x), _west(down))
+            s3, c3 = _half_add(down, _east(down))
+            ones, c4 = _full_add(s1, s2, s3)
+            s5, c5 = _full_add(c1, c2, c3)
+            twos, c6 = _half_add(s5, c4)
+            fours = c5 | c6  # set where the count is 4 or more
+            #alive if the count is 3, or the count is 2 and already alive
+            new = twos & ~fours & (ones | x)
+            if add_rule:
+                new |= self._rebirths(fours & ~x, r0, rng)
+            new[:, -1] &= self._last_mask
+            new_words[r0:r1] = new
+        return BitWorld(self.nr, self.nc, new_words)
+
+
+    def _rebirths(self, candidates, r0, rng):
+        """
+        Returns the words of the dead cells brought back to life by the
+        extra-life-rule, given the words of the candidate cells of a band
+        starting at row r0 (each candidate is reborn with probability 0.4)
+        """
+        candidates[:, -1] &= self._last_mask
+        rows, cols = np.nonzero(candidates)
+        reborn_words = np.zeros_like(candidates)
+        if len(rows) == 0:
+            return reborn_words
+        bits = _unpack_words(candidates[rows, cols])
+        k = int(bits.sum())
+        if rng is None:
+            draws = np.array([random.random() for _ in range(k)])
+        else:
+            draws = rng.random(k)
+        #draws are in row-major order: by word, then by bit within the word
+        reborn = np.zeros_like(bits)
+        reborn[bits] = draws <= 0.4
+        reborn_words[rows, cols] = pack_rows(reborn, 1)[:, 0]
+        return reborn_words
@@ -0,0 +1,121 @@
+# cycle_detect.py
+"""
+Detection of still lifes and oscillators for the Project 4 Game of Life
+
+Many worlds settle into a state that repeats every p generations (p = 1 for
+a still life).  Once that is known, generation n is the same as generation
+n - k*p for any k, so the remaining generations can be skipped.
+
+Each generation, the world is packed into bits and hashed with a polynomial
+rolling hash over its 64-bit words.  The hashes are kept in a bounded table.
+When a hash is seen again, the period is confirmed by checking that the
+world repeats exactly after one more period, so a hash collision cannot
+cause a wrong skip.
+"""
+import numpy as np
+
+HISTORY_SIZE = 4096  # maximum number of hashes kept
+BASE = np.uint64(0x9E3779B97F4A7C15)  # multiplier of the rolling hash
+
+
+def pack_world(w):
+    """
+    Returns a 1-d array of uint64 words holding the cells of w, one bit per
+    cell
+
+    Parameter w: a world matrix, or a BitWorld (anything with a words
+        attribute is taken as already packed)
+    """
+    if hasattr(w, 'words'):
+        return np.ascontiguousarray(w.words, dtype=np.uint64).ravel()
+    bits = np.packbits(np.asarray(w) == 1)
+    padded = np.zeros((len(bits) + 7)//8*8, dtype=np.uint8)
+    padded[:len(bits)] = bits
+    return padded.view(np.uint64)
+
+
+class CycleDetector:
+    """
+    A CycleDetector watches the generations of a run and finds when the
+    world starts repeating.
+
+    Attributes
+    ----------
+    transient : int or None
+        the first generation of the cycle, i.e., the number of generations
+        before the world starts repeating.  None until a cycle is confirmed.
+    period : int or None
+        the number of generations after which the world repeats.  None until
+        a cycle is confirmed.
+    """
+
+    def __init__(self, history_size=HISTORY_SIZE):
+        """
+        Initializes a CycleDetector object
+
+        Parameter history_size: (int) maximum number of hashes kept.  Cycles
+            whose first repeat comes more than history_size generations after
+            the earliest generation kept cannot be found.
+        """
+        self.history_size = history_size
+        self.transient = None
+        self.period = None
+        self._history = {}  # hash -> first generation with that hash
+        self._powers = None
+        self._probe = None  # (generation, words, first generation, period)
+
+
+    def _hash(self, words):
+        """
+        Returns (int) the rolling hash sum(words[i] * BASE**(i+1)) mod 2**64
+        """
+        if self._powers is None or len(self._powers) != len(words):
+            self._powers = np.cumprod(np.full(len(words), BASE,
+                                              dtype=np.uint64))
+        return int((words*self._powers).sum(dtype=np.uint64))
+
+
+    def check(self, generation, w):
+        """
+        Records the world w of generation `generation` (generations must be
+        checked in order, one at a time).  Returns True once a cycle is
+        confirmed; transient and period are then set.
+
+        Parameters
+        ----------
+        generation : (int) the generation of w
+
+        w : the world, a world matrix or a BitWorld
+        """
+        if self.period is not None:
+            return True
+        words = pack_world(w)
+        if self._probe is not None:
+            probe_gen, probe_words, first, period = self._probe
+            if generation == probe_gen + period:
+                if np.array_equal(words, probe_words):
+                    self.transient = first
+                    self.period = period
+                    return True
+                self._probe = None  # it was a hash collision
+            return False
+        h = self._hash(words)
+        if h in self._history:
+            first = self._history[h]
+            self._probe = (generation, words.copy(), first, generation - first)
+            return False
+        if len(self._history) >= self.history_size:
+            #forget the oldest generation (dicts keep insertion order)
+            del self._history[next(iter(self._history))]
+        self._history[h] = generation
+        return False
+
+
+    def remaining(self, generation, n):
+        """
+        Returns (int) the number of generations that still have to be
+        computed to reach generation n from generation `generation`, once a
+        cycle is confirmed: generation n is the same world as generation
+        `generation` + ((n - generation) % period)
+        """
+        return (n - generation) % self.period
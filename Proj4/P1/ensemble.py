@@ -0,0 +1,97 @@
+# ensemble.py
+"""
+Batch runs of many independent Game of Life worlds for Project 4
+
+B worlds of the same size are stacked into one (B, nr, nc) array of bools
+and all of them are advanced by one vectorized step, with no Python loop
+over the worlds and no plotting.  Each run returns the population
+statistics of every world at every generation, which is what is needed to
+study the extra-life-rule over thousands of random worlds.
+"""
+import numpy as np
+from life_rules import count_neighbors, apply_rules, random_cells
+
+
+def random_worlds(B, nr, nc, rng=None):
+    """
+    Returns a (B, nr, nc) array of bools holding B independent random worlds.
+    In each world, the element at [i,j] is alive with probability
+    1/(abs(i-j)+2), as in create_world(nr, nc, "random").
+
+    Parameters
+    ----------
+    B : the number of worlds
+
+    nr : the number of rows in each world
+
+    nc : the number of columns in each world
+
+    rng : a numpy.random.Generator.  Default: None, a new unseeded generator.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    return random_cells(np.arange(nr), nc, rng, (B,))
+
+
+def ensemble_step(worlds, add_rule, rng=None):
+    """
+    Returns a new (B, nr, nc) array of bools: every world of worlds after ONE
+    generation, with the rules of game_of_life.one_generation_later
+
+    Parameters
+    ----------
+    worlds : a (B, nr, nc) array of bools
+
+    add_rule : (bool) If True, apply extra-life-rule;
+               otherwise do not apply extra-life-rule.
+
+    rng : a numpy.random.Generator for the extra-life-rule.  Default: None,
+          a new unseeded generator.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    return apply_rules(worlds, count_neighbors(worlds), add_rule,
+                       rng).astype(bool, copy=False)
+
+
+def run_ensemble(n, worlds, add_rule, rng=None):
+    """
+    Advances a stack of worlds n generations and returns
+    (worlds, live, births, deaths):
+
+    worlds : the (B, nr, nc) array of bools of the worlds at generation n
+    live : (n+1, B) array, live[g, b] is the number of live cells of world b
+           at generation g
+    births : (n, B) array, births[g, b] is the number of dead cells of world
+             b at generation g that are alive at generation g+1
+    deaths : (n, B) array, deaths[g, b] is the number of live cells of world
+             b at generation g that are dead at generation g+1
+
+    Parameters
+    ----------
+    n : the number of generations, a non-negative int
+
+    worlds : a (B, nr, nc) array of bools (or of 0s and 1s), e.g., from
+             random_worlds
+
+    add_rule : (bool) If True, apply extra-life-rule;
+               otherwise do not apply extra-life-rule.
+
+    rng : a numpy.random.Generator for the extra-life-rule.  Default: None,
+          a new unseeded generator.
+    """
+    worlds = np.asarray(worlds) == 1
+    if rng is None:
+        rng = np.random.default_rng()
+    B = worlds.shape[0]
+    live = np.zeros((n + 1, B), dtype=np.int64)
+    births = np.zeros((n, B), dtype=np.int64)
+    deaths = np.zeros((n, B), dtype=np.int64)
+    live[0] = worlds.sum(axis=(1, 2))
+    for g in range(n):
+        new = ensemble_step(worlds, add_rule, rng)
+        births[g] = (new & ~worlds).sum(axis=(1, 2))
+        deaths[g] = (worlds & ~new).sum(axis=(1, 2))
+        live[g + 1] = new.sum(axis=(1, 2))
+        worlds = new
+    return worlds, live, births, deaths
@@ -0,0 +1,144 @@
+# frame_render.py
+"""
+Renderers for the Project 4 Game of Life animation
+
+A renderer is called once per generation with render(generation, w).  Two
+kinds are provided:
+
+- ImageRenderer draws in a matplotlib window like animate does, but keeps a
+  single AxesImage and only calls set_data on it, instead of clearing the
+  axes and calling matshow every generation.
+
+- FrameRenderer does not use matplotlib at all, so it runs on headless
+  servers.  Each generation is written into one preallocated uint8 frame
+  buffer and then saved as a numbered image file (binary PGM, which any
+  image tool reads) or written to a stream, e.g., the stdin of
+  "ffmpeg -f rawvideo -pix_fmt gray -s WIDTHxHEIGHT -i - movie.mp4".
+
+Both take every=k to draw only every k-th generation, so that long runs can
+be recorded cheaply.
+"""
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+class ImageRenderer:
+    """
+    An ImageRenderer shows the world in a matplotlib window, reusing one
+    AxesImage for all generations.
+    """
+
+    def __init__(self, blink, every=1):
+        """
+        Initializes an ImageRenderer object
+
+        Parameters
+        ----------
+        blink : (float) pause time in seconds after each frame drawn
+
+        every : (int) draw generation g only if g is a multiple of every.
+                Default: 1, draw all generations
+        """
+        self.blink = blink
+        self.every = every
+        self.image = None
+        self.axes = None
+
+
+    def render(self, generation, w):
+        """
+        Draws the world matrix w of generation `generation`, if it is one of
+        the generations to draw
+        """
+        if generation % self.every != 0:
+            return
+        if self.image is None:
+            plt.close()
+            fig, self.axes = plt.subplots()
+            #fixed color limits, since set_data does not rescale them
+            self.image = self.axes.matshow(w, vmin=0, vmax=1)
+        else:
+            self.image.set_data(w)
+        self.axes.set_title(f'Generation {generation}')
+        plt.pause(self.blink)
+
+
+    def close(self):
+        """
+        Does nothing; the window stays open
+        """
+        pass
+
+
+class FrameRenderer:
+    """
+    A FrameRenderer turns each generation into an 8-bit grayscale frame
+    (live cells white) in a preallocated buffer and saves it, without
+    matplotlib.
+
+    Attributes
+    ----------
+    frame : 2-d uint8 array
+        the frame buffer, (nr*scale)-by-(nc*scale), reused for every frame
+    """
+
+    def __init__(self, nr, nc, pattern=None, stream=None, scale=1, every=1):
+        """
+        Initializes a FrameRenderer object.  Give pattern or stream (or both).
+
+        Parameters
+        ----------
+        nr : number of rows of the world
+
+        nc : number of columns of the world
+
+        pattern : None or a file name pattern with a generation number field,
+                  e.g., 'frames/gen{:06d}.pgm'.  Each frame drawn is saved as
+                  a binary PGM image with that name.
+
+        stream : None or a binary file object, e.g., the stdin of an ffmpeg
+                 process.  The raw bytes of each frame drawn are written to
+                 it, one frame after the other.
+
+        scale : (int) each cell is drawn as a scale-by-scale square of pixels.
+                Default: 1
+
+        every : (int) draw generation g only if g is a multiple of every.
+                Default: 1, draw all generations
+        """
+        self.pattern = pattern
+        self.stream = stream
+        self.scale = scale
+        self.every = every
+        self.frame = np.zeros((nr*scale, nc*scale), dtype=np.uint8)
+        #view of the frame as (nr, scale, nc, scale) so that cells can be
+        #written into it with broadcasting, without a temporary image
+        self._cells = self.frame.reshape(nr, scale, nc, scale)
+        self.frames_written = 0
+
+
+    def render(self, generation, w):
+        """
+        Draws the world matrix w of generation `generation` into the frame
+        buffer and saves it, if it is one of the generations to draw
+        """
+        if generation % self.every != 0:
+            return
+        np.multiply(np.asarray(w)[:, None, :, None], 255,
+                    out=self._cells, casting='unsafe')
+        if self.pattern is not None:
+            height, width = self.frame.shape
+            with open(self.pattern.format(generation), 'wb') as fid:
+                fid.write(f'P5\n{width} {height}\n255\n'.encode())
+                fid.write(self.frame.tobytes())
+        if self.stream is not None:
+            self.stream.write(self.frame.tobytes())
+        self.frames_written += 1
+
+
+    def close(self):
+        """
+        Flushes the stream, if there is one
+        """
+        if self.stream is not None:
+            self.stream.flush()
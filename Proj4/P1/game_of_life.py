@@ -11,11 +11,52 @@ this once in a session (unless you restart the kernel).
 
 """
 import numpy as np
-import matplotlib.pyplot as plt
 import random
+from life_rules import count_neighbors, apply_rules, random_cells
+from bit_world import BitWorld
+from active_world import ActiveWorld
+from hashlife import HashWorld
+from seed_io import read_seed, load_bit_world
+from frame_render import ImageRenderer
+from tiled_life import TiledLife
 
 
-def create_world(nr, nc, data_mode):
+#number of cells generated at a time by random_rows
+CHUNK_CELLS = 2**22
+
+
+def random_rows(nr, nc, rng=None, chunk_rows=None):
+    """
+    Generates the rows of a random nr-by-nc world, a chunk of rows at a time.
+    The element at [i,j] is 1 with probability 1/(abs(i-j)+2); otherwise 0.
+
+    Yields tuples (r0, block) where block is a 2-d float array of 0s and 1s
+    holding rows r0, r0+1, ... of the world.  Only one chunk of random
+    numbers is in memory at a time, so huge worlds can be generated.
+
+    Parameters
+    ----------
+    nr : the number of rows in the world
+
+    nc : the number of columns in the world
+
+    rng : a numpy.random.Generator.  Pass a seeded one, e.g.,
+          np.random.default_rng(1112), to get the same world again.
+          Default: None, a new unseeded generator.
+
+    chunk_rows : number of rows per chunk.  Default: None, as many rows as
+                 fit in CHUNK_CELLS cells.
+    """
+    if rng is None:
+        rng=np.random.default_rng()
+    if chunk_rows is None:
+        chunk_rows=max(1, CHUNK_CELLS//nc)
+    for r0 in range(0, nr, chunk_rows):
+        rows=np.arange(r0, min(r0+chunk_rows, nr))
+        yield r0, random_cells(rows, nc, rng).astype(float)
+
+
+def create_world(nr, nc, data_mode, rng=None):
     """
     Returns an nr-by-nc array of ints representing the game of life world
     
@@ -33,19 +74,19 @@ def create_world(nr, nc, data_mode):
     - The string name of a plain text file storing the initial state.  If the
       world read from the file is bigger than nr-by-nc, use only the rows and
       columns of data that fit on the nr-by-nc array to be returned
+      The file can also be a '.rle', '.cells' or binary '.bin' seed (see
+      seed_io.py).  Reading stops after the first nr rows and nc columns.
+
+    rng : the numpy.random.Generator used when data_mode is "random".
+          Default: None, a new unseeded generator.
     """
     if data_mode=='random':
         w=np.zeros((nr,nc)) #creates an array of zeros that will be modified
-        for i in range(nr):
-            for j in range(nc):
-                #determines whether cell is alive (1) or dead (0) based on probability
-                random_float=random.random()
-                if random_float<=1/(abs(i-j)+2):
-                    w[i,j]=1
+        for r0, block in random_rows(nr, nc, rng):
+            w[r0:r0+len(block)]=block
     else:
-        w_0=np.loadtxt(data_mode, 'int', '#')
-        w=w_0[0:nr,0:nc] #creates a subarray of w_0 that shows only the first
-                         #nr rows and nr columns w_0
+        w=read_seed(data_mode, nr, nc) #reads only the first nr rows and
+                                       #nc columns of the file
     return w
     
 
@@ -180,7 +221,39 @@ def one_generation_later(w, add_rule):
                     new_w[i,j]=0
     return new_w
 
-def simulate(n, nr, nc, data_mode, add_rule, blink):
+
+def one_generation_later_vec(w, add_rule):
+    """
+    Returns a new array representing the world matrix w after ONE generation
+    according to the rules of the game of life
+
+    Same result as one_generation_later, but the neighbors of all the cells
+    are counted at once with shifted slices instead of a double loop.  With
+    the extra-life-rule the random draws are made in the same order as in
+    one_generation_later, so both functions give the same world for the same
+    random.seed.
+
+    Parameters
+    ----------
+    w : the world matrix, a 2-d array.
+
+    add_rule: (bool) If True, apply extra-life-rule;
+              otherwise do not apply extra-life-rule.
+    """
+    return apply_rules(w, count_neighbors(w == 1), add_rule)
+
+
+#stepping functions that simulate can use, by engine name.  Each one takes
+#(world, add_rule) and returns the world one generation later.
+ENGINES = {'loop': one_generation_later, 'vector': one_generation_later_vec,
+           'bits': BitWorld.one_generation_later,
+           'active': ActiveWorld.one_generation_later,
+           'hashlife': HashWorld.one_generation_later,
+           'tiled': TiledLife.one_generation_later}
+
+
+def simulate(n, nr, nc, data_mode, add_rule, blink, engine='loop', rng=None,
+             renderer=None, cycles=None):
     """
     Returns the world matrix after simulating n generations of the game of life
     
@@ -207,39 +280,120 @@ def simulate(n, nr, nc, data_mode, add_rule, blink):
     blink : a positive float.  blink > 1 means no animation
             blink <= 1 is the blink rate of the animation, i.e., the pause time
             in seconds between generations 
+
+    engine : (string) name of the stepping function in ENGINES used to
+             compute each generation.  Default: 'loop'
+             With 'bits' the world is kept bit-packed (see bit_world.py), a
+             seed file is padded with dead cells to nr-by-nc, and the
+             BitWorld itself is returned, so that worlds too big for a world
+             matrix can be simulated (use blink > 1 for those).
+             With 'active' only the tiles near cells that changed in the
+             previous generation are recomputed (see active_world.py).
+             With 'hashlife' the world is a window of an unbounded plane
+             advanced with HashLife (see hashlife.py); without animation the
+             n generations are done in jumps of 2**k generations, so n can
+             be in the millions.  add_rule must be False.
+             With 'tiled' bands of rows are computed in parallel by one
+             worker process per core (see tiled_life.py); the random draws
+             of the extra-life-rule come from rng instead of random.
+
+    rng : the numpy.random.Generator used when data_mode is "random".
+          Default: None, a new unseeded generator.
+
+    renderer : None or an object with methods render(generation, w) and
+               close() and an attribute every, e.g., a FrameRenderer to
+               record the run without a window (see frame_render.py).  Only
+               the generations that are multiples of renderer.every are
+               rendered.  Default: None, an ImageRenderer if blink <= 1,
+               otherwise no animation.
+
+    cycles : None or a CycleDetector (see cycle_detect.py).  If given, each
+             generation is checked for a repeat of an earlier one; once the
+             world is found to repeat with period p, the generations left are
+             skipped arithmetically (only when there is no animation).  The
+             detected transient length and period are then in
+             cycles.transient and cycles.period.  Ignored when add_rule is
+             True, since the extra-life-rule is random.
     """
-    world=create_world(nr,nc,data_mode)
-    #animation for original grid
-    plt.close()
-    fig, ax=plt.subplots()
-    ax.matshow(world)
-    ax.set_title('Generation 0')
-    plt.pause(blink)
-    #print(world)
-    for i in range(n):
-        world=one_generation_later(world, add_rule)
-        animate(ax, i+1, world, blink)
+    step=ENGINES[engine]
+    if engine=='bits':
+        if data_mode=='random':
+            world=BitWorld.from_rows(nr,nc,random_rows(nr,nc,rng))
+        else:
+            world=load_bit_world(data_mode,nr,nc)
+    elif engine=='active':
+        world=ActiveWorld.from_array(create_world(nr,nc,data_mode,rng))
+    elif engine=='hashlife':
+        if add_rule:
+            raise ValueError('HashLife does not support the extra-life-rule')
+        w=create_world(nr,nc,data_mode,rng)
+        window=np.zeros((nr,nc)) #the nr-by-nc window, padded with dead cells
+        window[:w.shape[0],:w.shape[1]]=w
+        world=HashWorld(window)
+    elif engine=='tiled':
+        seed=None if rng is None else int(rng.integers(2**63))
+        world=TiledLife(create_world(nr,nc,data_mode,rng),seed=seed)
+    else:
+        world=create_world(nr,nc,data_mode,rng)
+    if renderer is None and blink<=1:
+        renderer=ImageRenderer(blink)
+    try:
+        if renderer is not None:
+            #animation for original grid
+            renderer.render(0, as_matrix(world))
+        elif engine=='hashlife':
+            #no animation: jump straight to generation n
+            return world.advance(n).to_array()
+        if add_rule:
+            cycles=None #the extra-life-rule is random, so repeats mean nothing
+        if cycles is not None:
+            cycles.check(0, packable(world))
         #print(world)
-        
-    
-#### TO-DO: Specify and implement at least one helper function here
-def animate(axes, generation, w, time):
+        last=n #generation at which to stop
+        g=0
+        while g<last:
+            world=step(world, add_rule)
+            g+=1
+            if renderer is not None and g%renderer.every==0:
+                renderer.render(g, as_matrix(world))
+            if cycles is not None and last==n and cycles.check(g, packable(world)):
+                if renderer is None:
+                    #generation n is the same world as this generation plus the
+                    #remainder of the generations left divided by the period
+                    last=g+cycles.remaining(g, n)
+            #print(world)
+        if renderer is not None:
+            renderer.close()
+        if engine!='bits':
+            return as_matrix(world)
+        return world
+    finally:
+        if engine=='tiled':
+            world.close() #stop the workers and free the shared memory
+
+
+def packable(world):
     """
-    Returns None
-    
-    Parameters
-    ----------
-    axes: axes reference
-    generation: how many times generations have been generated
-    w: the world matrix
-    time: blink
+    Returns world itself if it is a world matrix or a BitWorld, otherwise
+    its world matrix, for CycleDetector.check
+
+    Parameter world: a world matrix or one of the world objects of simulate
     """
+    if isinstance(world, BitWorld):
+        return world
+    return as_matrix(world)
 
-    axes.clear()
-    axes.matshow(w)
-    axes.set_title(f'Generation {generation}')
-    plt.pause(time)
 
+def as_matrix(world):
+    """
+    Returns world as a world matrix (2-d array), unpacking it if it is a
+    BitWorld, an ActiveWorld, a HashWorld or a TiledLife
+
+    Parameter world: a world matrix or one of the world objects above
+    """
+    if isinstance(world, (BitWorld, ActiveWorld, HashWorld, TiledLife)):
+        return world.to_array()
+    return world
 
 
 #### Script code
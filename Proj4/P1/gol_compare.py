@@ -0,0 +1,101 @@
+# gol_compare.py
+"""
+Script to compare the loop and the vectorized stepping functions of the
+Project 4 Game of Life, side by side
+
+First checks that both functions give exactly the same worlds (with and
+without the extra-life-rule), and that simulate gives the same world matrix
+with the active-region engine, then times one generation of each on worlds of
+increasing size and plots time vs size.  Last, compares the vectorized
+function with the active-region ActiveWorld on the p48 gun, which leaves
+most of a big board empty.
+"""
+import matplotlib.pyplot as plt
+import numpy as np
+import random
+import time
+from game_of_life import create_world, one_generation_later, \
+                         one_generation_later_vec, simulate
+from active_world import ActiveWorld
+
+# Equivalence check: run both functions from the same world and the same
+# random seed for a few generations and compare the worlds
+for add_rule in [False, True]:
+    for data_mode in ['random', 'seeds_glider.txt', 'seeds_p48.txt']:
+        w_loop = create_world(40, 60, data_mode)
+        w_vec = w_loop.copy()
+        for g in range(20):
+            random.seed(g)
+            w_loop = one_generation_later(w_loop, add_rule)
+            random.seed(g)
+            w_vec = one_generation_later_vec(w_vec, add_rule)
+            assert np.array_equal(w_loop, w_vec), \
+                f'{data_mode}, add_rule={add_rule}: differ at generation {g+1}'
+print('Loop and vectorized versions give the same worlds')
+
+# simulate returns the same world matrix with the active-region engine as
+# with the vectorized one
+for data_mode in ['random', 'seeds_glider.txt', 'seeds_p48.txt']:
+    w_vec = simulate(30, 60, 80, data_mode, False, 2, 'vector',
+                     np.random.default_rng(1))
+    w_active = simulate(30, 60, 80, data_mode, False, 2, 'active',
+                        np.random.default_rng(1))
+    assert np.array_equal(w_vec, w_active), \
+        f'{data_mode}: active engine differs from the vectorized one'
+print('Active-region and vectorized engines give the same worlds')
+
+# Time one generation on square random worlds of different sizes
+sizes = np.array([25, 50, 100, 200, 400])
+num_sizes = len(sizes)
+num_gens = 3             # generations timed for each size
+time_loop = np.zeros(num_sizes)
+time_vec = np.zeros(num_sizes)
+
+for b in range(num_sizes):
+    w = create_world(sizes[b], sizes[b], 'random')
+
+    tstart = time.time()
+    for g in range(num_gens):
+        one_generation_later(w, True)
+    time_loop[b] = (time.time() - tstart)/num_gens
+
+    tstart = time.time()
+    for g in range(num_gens):
+        one_generation_later_vec(w, True)
+    time_vec[b] = (time.time() - tstart)/num_gens
+
+    print(f'{sizes[b]:5d} x {sizes[b]:<5d} loop {time_loop[b]:10.5f} s',
+          f'  vectorized {time_vec[b]:10.5f} s',
+          f'  speedup {time_loop[b]/time_vec[b]:8.1f}')
+
+# Plot time vs world size for both versions on one set of axes
+plt.loglog(sizes**2, time_loop, 'b-o', sizes**2, time_vec, 'm-d')
+plt.title('Average time to compute one generation')
+plt.xlabel('Number of cells')
+plt.ylabel('Time in seconds')
+plt.legend(['Loop', 'Vectorized'])
+plt.show()
+
+# Sparse pattern: the p48 gun in the corner of a big board.  The active-region
+# world recomputes only the tiles near the cells that changed.
+seed = create_world(49, 54, 'seeds_p48.txt')
+num_gens = 100
+for size in [500, 1000, 2000]:
+    w = np.zeros((size, size))
+    w[:49, :54] = seed
+    a = ActiveWorld.from_array(w)
+
+    tstart = time.time()
+    for g in range(num_gens):
+        w = one_generation_later_vec(w, False)
+    t_vec = (time.time() - tstart)/num_gens
+
+    tstart = time.time()
+    for g in range(num_gens):
+        a.one_generation_later(False)
+    t_active = (time.time() - tstart)/num_gens
+
+    assert np.array_equal(w, a.to_array())
+    print(f'p48 gun on {size} x {size}: vectorized {t_vec:10.5f} s',
+          f'  active region {t_active:10.5f} s',
+          f'  ({a.num_active()} of {a.active.size} tiles active)')
@@ -0,0 +1,376 @@
+# hashlife.py
+"""
+HashLife engine for very long Game of Life runs (Project 4)
+
+The world is stored as a quadtree whose identical sub-squares are shared, and
+the result of advancing each sub-square is memoized.  A square of side 2**k
+can then be advanced 2**j generations (j <= k-2) in one call, so periodic
+patterns and guns can be run for millions of generations.
+
+HashLife works on an unbounded plane: cells outside the nr-by-nc window are
+not forced to stay dead as in one_generation_later, so patterns that reach
+the border of the window (e.g., gliders) keep going instead of hitting a
+wall.  Inside the window the result is the same as the other engines for as
+long as nothing has reached the border.  The extra-life-rule is random and
+cannot be memoized, so it is not supported.
+"""
+import numpy as np
+from functools import lru_cache
+
+CACHE_SIZE = 2**20  # default number of results kept by each memo cache
+
+
+class Node:
+    """
+    A Node is a square of 2**k by 2**k cells of a quadtree.
+
+    Attributes
+    ----------
+    k : int
+        level of the node; the square has side 2**k.  Level 0 is one cell.
+    nw, ne, sw, se : Node
+        the four quadrants (north-west, north-east, south-west, south-east),
+        each of level k-1.  None for a level 0 node.
+    pop : int
+        number of live cells in the square
+    """
+    __slots__ = ('k', 'nw', 'ne', 'sw', 'se', 'pop')
+
+    def __init__(self, k, nw, ne, sw, se, pop):
+        self.k = k
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.pop = pop
+
+
+ON = Node(0, None, None, None, None, 1)
+OFF = Node(0, None, None, None, None, 0)
+
+
+class HashLife:
+    """
+    A HashLife object holds the memo caches used to build and advance
+    quadtrees: one for the nodes (so that equal squares are the same Node)
+    and one for the successors of the nodes.
+
+    The caches are bounded: between two jumps of advance, if they hold more
+    than cache_size results, they are emptied and the current quadtree is
+    put back in the node cache, keeping only the nodes still in use.  The
+    caches are not emptied in the middle of a jump, because evicting the
+    nodes that the jump is working on makes it recompute them over and over.
+    """
+
+    def __init__(self, cache_size=CACHE_SIZE):
+        """
+        Initializes a HashLife object
+
+        Parameter cache_size: (int) maximum number of results kept by the
+            memo caches between two jumps.  Default: CACHE_SIZE
+        """
+        self.cache_size = cache_size
+        self.join = lru_cache(maxsize=None)(self._join)
+        self.zero = lru_cache(maxsize=None)(self._zero)
+        self.successor = lru_cache(maxsize=None)(self._successor)
+
+
+    def cache_count(self):
+        """
+        Returns (int) the number of results held by the memo caches
+        """
+        return (self.join.cache_info().currsize +
+                self.successor.cache_info().currsize)
+
+
+    def collect(self, m):
+        """
+        Empties the memo caches and returns a Node equal to m whose nodes are
+        back in the node cache
+
+        Parameter m: the Node of the quadtree still in use
+        """
+        self.join.cache_clear()
+        self.zero.cache_clear()
+        self.successor.cache_clear()
+        return self._intern(m, {})
+
+
+    def _intern(self, m, done):
+        """
+        Returns the Node of the node cache equal to Node m.  done maps the id
+        of the nodes already interned to their new Node.
+        """
+        if m.k == 0:
+            return m
+        if id(m) not in done:
+            done[id(m)] = self.join(self._intern(m.nw, done),
+                                    self._intern(m.ne, done),
+                                    self._intern(m.sw, done),
+                                    self._intern(m.se, done))
+        return done[id(m)]
+
+
+    def _join(self, nw, ne, sw, se):
+        """
+        Returns the Node of level k+1 made of four Nodes of level k
+        """
+        return Node(nw.k + 1, nw, ne, sw, se, nw.pop + ne.pop + sw.pop + se.pop)
+
+
+    def _zero(self, k):
+        """
+        Returns the empty Node of level k
+        """
+        if k == 0:
+            return OFF
+        z = self.zero(k - 1)
+        return self.join(z, z, z, z)
+
+
+    def centre(self, m):
+        """
+        Returns a Node of level k+1 with m in its center and dead cells around
+        """
+        z = self.zero(m.k - 1)
+        return self.join(self.join(z, z, z, m.nw), self.join(z, z, m.ne, z),
+                         self.join(z, m.sw, z, z), self.join(m.se, z, z, z))
+
+
+    def _life_4x4(self, m):
+        """
+        Returns the Node of level 1 at the center of the level 2 Node m, one
+        generation later
+        """
+        #cells of the 4-by-4 square, row by row
+        quads = (m.nw, m.ne, m.sw, m.se)
+        cells = np.zeros((4, 4), dtype=int)
+        for q in range(4):
+            sub = (quads[q].nw, quads[q].ne, quads[q].sw, quads[q].se)
+            for s in range(4):
+                cells[2*(q//2) + s//2, 2*(q % 2) + s % 2] = sub[s].pop
+        new = []
+        for i in (1, 2):
+            for j in (1, 2):
+                count = cells[i - 1:i + 2, j - 1:j + 2].sum() - cells[i, j]
+                alive = count == 3 or (count == 2 and cells[i, j] == 1)
+                new.append(ON if alive else OFF)
+        return self.join(*new)
+
+
+    def _successor(self, m, j):
+        """
+        Returns the Node of level k-1 at the center of the Node m (level
+        k >= 2) advanced 2**j generations, where 0 <= j <= k-2
+        """
+        if m.pop == 0:
+            return m.nw
+        if m.k == 2:
+            return self._life_4x4(m)
+        join = self.join
+        #nine overlapping sub-squares of level k-1
+        a, b, c, d = m.nw, m.ne, m.sw, m.se
+        n00 = a
+        n01 = join(a.ne, b.nw, a.se, b.sw)
+        n02 = b
+        n10 = join(a.sw, a.se, c.nw, c.ne)
+        n11 = join(a.se, b.sw, c.ne, d.nw)
+        n12 = join(b.sw, b.se, d.nw, d.ne)
+        n20 = c
+        n21 = join(c.ne, d.nw, c.se, d.sw)
+        n22 = d
+        if j == m.k - 2:
+            #two half steps of 2**(k-3) generations each
+            step = lambda x: self.successor(x, j - 1)
+            c00, c01, c02 = step(n00), step(n01), step(n02)
+            c10, c11, c12 = step(n10), step(n11), step(n12)
+            c20, c21, c22 = step(n20), step(n21), step(n22)
+            return join(step(join(c00, c01, c10, c11)),
+                        step(join(c01, c02, c11, c12)),
+                        step(join(c10, c11, c20, c21)),
+                        step(join(c11, c12, c21, c22)))
+        #fewer generations: advance the nine sub-squares the full 2**j, then
+        #take the centers of the four overlapping groups without stepping
+        step = lambda x: self.successor(x, j)
+        c00, c01, c02 = step(n00), step(n01), step(n02)
+        c10, c11, c12 = step(n10), step(n11), step(n12)
+        c20, c21, c22 = step(n20), step(n21), step(n22)
+        centre = lambda w, x, y, z: join(w.se, x.sw, y.ne, z.nw)
+        return join(centre(c00, c01, c10, c11), centre(c01, c02, c11, c12),
+                    centre(c10, c11, c20, c21), centre(c11, c12, c21, c22))
+
+
+    def from_array(self, w):
+        """
+        Returns the smallest Node (level >= 3) holding the world matrix w in
+        its north-west corner
+
+        Parameter w: the world matrix, a 2-d array of 0s and 1s
+        """
+        nr, nc = np.shape(w)
+        k = 3
+        while 2**k < max(nr, nc):
+            k += 1
+        padded = np.zeros((2**k, 2**k), dtype=bool)
+        padded[:nr, :nc] = np.asarray(w) == 1
+        return self._build(padded, 0, 0, k)
+
+
+    def _build(self, cells, r, c, k):
+        """
+        Returns the Node of level k for cells[r:r+2**k, c:c+2**k]
+        """
+        if k == 0:
+            return ON if cells[r, c] else OFF
+        half = 2**(k - 1)
+        if not cells[r:r + 2*half, c:c + 2*half].any():
+            return self.zero(k)
+        return self.join(self._build(cells, r, c, k - 1),
+                         self._build(cells, r, c + half, k - 1),
+                         self._build(cells, r + half, c, k - 1),
+                         self._build(cells, r + half, c + half, k - 1))
+
+
+    def to_array(self, m, r0, c0, nr, nc):
+        """
+        Returns the nr-by-nc float world matrix of the cells of the window
+        with top-left corner (0, 0), given a Node m whose top-left corner is
+        at row r0, column c0 (which can be negative)
+        """
+        w = np.zeros((nr, nc))
+        self._fill(w, m, r0, c0)
+        return w
+
+
+    def _fill(self, w, m, r, c):
+        """
+        Sets the live cells of Node m (top-left corner at row r, column c)
+        that fall inside w
+        """
+        size = 2**m.k
+        nr, nc = np.shape(w)
+        if m.pop == 0 or r >= nr or c >= nc or r + size <= 0 or c + size <= 0:
+            return
+        if m.k == 0:
+            w[r, c] = 1
+            return
+        half = size//2
+        self._fill(w, m.nw, r, c)
+        self._fill(w, m.ne, r, c + half)
+        self._fill(w, m.sw, r + half, c)
+        self._fill(w, m.se, r + half, c + half)
+
+
+    def advance(self, m, r0, c0, n):
+        """
+        Returns (node, r0, c0): the Node m (top-left corner at row r0,
+        column c0) advanced n generations, and the position of the top-left
+        corner of the returned Node
+
+        The generations are done in jumps of 2**j, one jump per bit of n.
+        Before each jump the node is padded with dead cells until its live
+        cells are all in the center quarter and it is big enough, so that no
+        live cell can leave the returned square during the jump.
+        """
+        j = 0
+        while n > 0:
+            if n & 1:
+                if self.cache_count() > self.cache_size:
+                    m = self.collect(m)
+                while m.k < j + 3 or not self._in_centre_quarter(m):
+                    half = 2**(m.k - 1)
+                    m = self.centre(m)
+                    r0 -= half
+                    c0 -= half
+                m = self.successor(m, j)
+                r0 += 2**(m.k - 1)
+                c0 += 2**(m.k - 1)
+            n >>= 1
+            j += 1
+        return m, r0, c0
+
+
+    def _in_centre_quarter(self, m):
+        """
+        Returns True if all live cells of Node m (level >= 3) are in the
+        center square of side 2**(k-2)
+        """
+        inner = (m.nw.se.se.pop + m.ne.sw.sw.pop + m.sw.ne.ne.pop +
+                 m.se.nw.nw.pop)
+        return inner == m.pop
+
+
+class HashWorld:
+    """
+    A HashWorld is the nr-by-nc window (top-left corner at row 0, column 0)
+    of an unbounded Game of Life plane stored as a HashLife quadtree.
+
+    Attributes
+    ----------
+    nr : int
+        number of rows of the window
+    nc : int
+        number of columns of the window
+    life : HashLife
+        the memo caches used to advance the quadtree
+    root : Node
+        the quadtree holding all the live cells
+    r0, c0 : int
+        row and column of the top-left corner of root
+    """
+
+    def __init__(self, w, cache_size=CACHE_SIZE):
+        """
+        Initializes a HashWorld object from a world matrix
+
+        Parameters
+        ----------
+        w : the world matrix, an nr-by-nc array of 0s and 1s
+
+        cache_size : (int) maximum number of results kept by the memo caches
+                     between two jumps
+        """
+        self.nr, self.nc = np.shape(w)
+        self.life = HashLife(cache_size)
+        self.root = self.life.from_array(w)
+        self.r0 = 0
+        self.c0 = 0
+
+
+    def advance(self, n):
+        """
+        Advances self n generations in place and returns self
+
+        Parameter n: the number of generations, a non-negative int (can be in
+            the millions)
+        """
+        self.root, self.r0, self.c0 = self.life.advance(self.root, self.r0,
+                                                        self.c0, n)
+        return self
+
+
+    def one_generation_later(self, add_rule):
+        """
+        Advances self ONE generation in place and returns self
+
+        Parameter add_rule: (bool) must be False; the extra-life-rule is
+            random and is not supported by HashLife
+        """
+        if add_rule:
+            raise ValueError('HashLife does not support the extra-life-rule')
+        return self.advance(1)
+
+
+    def population(self):
+        """
+        Returns (int) the number of live cells on the whole plane, including
+        the ones outside the window
+        """
+        return self.root.pop
+
+
+    def to_array(self):
+        """
+        Returns the nr-by-nc world matrix (2-d float array) of the window
+        """
+        return self.life.to_array(self.root, self.r0, self.c0, self.nr, self.nc)
@@ -0,0 +1,102 @@
+# life_rules.py
+"""
+Vectorized building blocks for the Project 4 Game of Life
+
+The functions here work on whole arrays at once instead of visiting one cell
+at a time.  They operate on the LAST TWO axes of an array, so the same code
+steps a single nr-by-nc world or a stack of worlds with shape (B, nr, nc).
+Cells outside the world are treated as dead, exactly like the edge and corner
+cases of one_generation_later in game_of_life.py.
+"""
+import numpy as np
+import random
+
+
+def count_neighbors(alive):
+    """
+    Returns an array of uint8 with the same shape as alive where each element
+    is the number of live neighbors (0 to 8) of the corresponding cell
+
+    Parameters
+    ----------
+    alive : an array of bools (or of 0s and 1s) whose last two axes are the
+            rows and columns of the world.  Cells beyond the edges are dead.
+    """
+    a = np.asarray(alive, dtype=np.uint8)
+    counts = np.zeros(a.shape, dtype=np.uint8)
+    #add each of the 8 shifted copies of the world using slices, so that
+    #no padded copy of the world has to be made
+    counts[..., 1:, :] += a[..., :-1, :]     #neighbor above
+    counts[..., :-1, :] += a[..., 1:, :]     #neighbor below
+    counts[..., :, 1:] += a[..., :, :-1]     #neighbor to the left
+    counts[..., :, :-1] += a[..., :, 1:]     #neighbor to the right
+    counts[..., 1:, 1:] += a[..., :-1, :-1]  #upper left
+    counts[..., 1:, :-1] += a[..., :-1, 1:]  #upper right
+    counts[..., :-1, 1:] += a[..., 1:, :-1]  #lower left
+    counts[..., :-1, :-1] += a[..., 1:, 1:]  #lower right
+    return counts
+
+
+def random_cells(rows, nc, rng, size=()):
+    """
+    Returns an array of bools of shape size+(len(rows), nc) holding rows of
+    random worlds: element [..., k, j] is alive with probability
+    1/(abs(rows[k]-j)+2), as in create_world(nr, nc, "random")
+
+    Parameters
+    ----------
+    rows : a 1-d int array of the row numbers to generate
+
+    nc : the number of columns in the world
+
+    rng : a numpy.random.Generator
+
+    size : the shape of the stack of worlds.  Default: (), a single world
+    """
+    #u <= 1/(d+2) is the same test as u*(d+2) <= 1, with no division
+    draws = rng.random(tuple(size) + (len(rows), nc))
+    draws *= np.abs(np.asarray(rows)[:, None] - np.arange(nc)) + 2
+    return draws <= 1
+
+
+def apply_rules(w, counts, add_rule, rng=None):
+    """
+    Returns a new array of the dtype of w holding the next generation of w
+    given the neighbor counts of every cell
+
+    The rules are the ones of one_generation_later: fewer than 2 neighbors
+    dies, exactly 2 keeps its state, exactly 3 is alive, more than 3 dies.
+    With the extra-life-rule, a dead cell with more than 3 neighbors comes
+    back to life with probability 0.4.
+
+    Parameters
+    ----------
+    w : the world matrix (or a stack of worlds), an array of 0s and 1s
+
+    counts : the neighbor counts of w, as returned by count_neighbors
+
+    add_rule : (bool) If True, apply extra-life-rule;
+               otherwise do not apply extra-life-rule.
+
+    rng : None or a numpy.random.Generator.  If None, one random.random()
+          draw is made per candidate cell in row-major order, which is the
+          same sequence of draws that one_generation_later makes, so both
+          give identical worlds for the same random.seed.  Otherwise the
+          draws come from rng.
+    """
+    w = np.asarray(w)
+    new_w = np.zeros(w.shape, dtype=w.dtype)
+    keep = counts == 2
+    new_w[keep] = w[keep]
+    new_w[counts == 3] = 1
+    if add_rule:
+        #np.nonzero lists the candidates in row-major order
+        candidates = np.nonzero((counts > 3) & (w == 0))
+        k = len(candidates[0])
+        if rng is None:
+            draws = np.array([random.random() for _ in range(k)])
+        else:
+            draws = rng.random(k)
+        reborn = draws <= 0.4
+        new_w[tuple(idx[reborn] for idx in candidates)] = 1
+    return new_w
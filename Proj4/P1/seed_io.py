@@ -0,0 +1,271 @@
+# seed_io.py
+"""
+Readers and writers of Game of Life seed files for Project 4
+
+Three kinds of seed files can be read:
+
+- Plain text seeds like seeds_glider.txt: rows of 0s and 1s separated by
+  spaces, with comments starting with '#'.  Only the rows and columns needed
+  are read, so a huge seed file is not parsed just to be cut down.
+
+- Patterns from the LifeWiki (www.conwaylife.com): run length encoded
+  '.rle' files and plaintext '.cells' files.
+
+- Binary seeds ('.bin'): a 24-byte header (the 8 bytes b'GOLBITS1', then
+  the number of rows and of columns as little-endian uint64), then one row
+  after the other with one bit per cell, 64 cells per little-endian uint64
+  word, as in a BitWorld.  The file is memory-mapped with np.memmap, so
+  only the rows that are used are read from disk.
+
+convert_seed converts any of them to a binary (or plain text) seed.
+"""
+import numpy as np
+from bit_world import BitWorld, pack_rows
+
+MAGIC = b'GOLBITS1'
+HEADER_BYTES = 24
+
+
+def read_seed(filename, nr, nc):
+    """
+    Returns a 2-d array of ints holding the first nr rows and nc columns of a
+    seed file (fewer if the seed is smaller), like np.loadtxt(filename,
+    'int', '#')[0:nr, 0:nc]
+
+    Parameters
+    ----------
+    filename : (string) name of a '.txt', '.rle', '.cells' or '.bin' seed
+
+    nr : the maximum number of rows to read
+
+    nc : the maximum number of columns to read
+    """
+    if filename.endswith('.bin'):
+        return read_bin(filename, nr, nc)
+    if filename.endswith('.rle'):
+        return read_rle(filename)[0:nr, 0:nc]
+    if filename.endswith('.cells'):
+        return read_cells(filename)[0:nr, 0:nc]
+    return read_txt(filename, nr, nc)
+
+
+def read_txt(filename, nr, nc):
+    """
+    Returns a 2-d array of ints holding the first nr rows and nc columns of
+    a plain text seed file.  Reading stops after row nr, and only the first
+    nc values of each line are split off.
+
+    Parameters
+    ----------
+    filename : (string) name of the seed file
+
+    nr : the maximum number of rows to read
+
+    nc : the maximum number of columns to read
+    """
+    rows = []
+    with open(filename, 'r') as fid:
+        for line in fid:
+            values = line.split('#')[0].split(None, nc)[:nc]
+            if values == []:
+                continue
+            rows.append(values)
+            if len(rows) == nr:
+                break
+    if rows == []:
+        return np.zeros((0, 0), dtype=int)  # empty seed, as read_cells
+    return np.array(rows, dtype=int).reshape(len(rows), -1)
+
+
+def read_rle(filename):
+    """
+    Returns a 2-d array of ints with the pattern of a run length encoded
+    ('.rle') file.  Lines starting with '#' are comments; the header line
+    'x = ..., y = ...' gives the size of the pattern.
+
+    Parameter filename: (string) name of the '.rle' file
+    """
+    body = ''
+    with open(filename, 'r') as fid:
+        for line in fid:
+            line = line.strip()
+            if line.startswith('#') or line == '':
+                continue
+            if line.startswith('x'):
+                size = {}
+                for item in line.split(','):
+                    key, value = item.split('=')
+                    size[key.strip()] = value.strip()
+                ncols = int(size['x'])
+                nrows = int(size['y'])
+                continue
+            body += line
+    w = np.zeros((nrows, ncols), dtype=int)
+    i = 0
+    j = 0
+    count = ''
+    for ch in body.split('!')[0]:
+        if ch.isdigit():
+            count += ch
+            continue
+        run = int(count) if count != '' else 1
+        count = ''
+        if ch == '$':
+            i += run
+            j = 0
+        else:
+            if ch != 'b':
+                w[i, j:j + run] = 1
+            j += run
+    return w
+
+
+def read_cells(filename):
+    """
+    Returns a 2-d array of ints with the pattern of a plaintext ('.cells')
+    file: lines starting with '!' are comments, '.' is a dead cell and 'O'
+    is a live cell
+
+    Parameter filename: (string) name of the '.cells' file
+    """
+    lines = []
+    with open(filename, 'r') as fid:
+        for line in fid:
+            if not line.startswith('!'):
+                lines.append(line.rstrip())
+    ncols = max([len(line) for line in lines] + [0])
+    w = np.zeros((len(lines), ncols), dtype=int)
+    for i in range(len(lines)):
+        for j in range(len(lines[i])):
+            if lines[i][j] in 'O*':
+                w[i, j] = 1
+    return w
+
+
+def open_bin(filename):
+    """
+    Returns (nr, nc, words): the size of the world of a binary seed file and
+    a read-only np.memmap of its nr-by-ceil(nc/64) little-endian uint64 words
+
+    Parameter filename: (string) name of the '.bin' file
+    """
+    with open(filename, 'rb') as fid:
+        header = fid.read(HEADER_BYTES)
+    if header[:8] != MAGIC:
+        raise ValueError(f'{filename} is not a binary seed file')
+    nr, nc = np.frombuffer(header[8:], dtype='<u8')
+    nr = int(nr)
+    nc = int(nc)
+    words = np.memmap(filename, dtype='<u8', mode='r', offset=HEADER_BYTES,
+                      shape=(nr, (nc + 63)//64))
+    return nr, nc, words
+
+
+def read_bin(filename, nr, nc):
+    """
+    Returns a 2-d array of ints holding the first nr rows and nc columns of
+    a binary seed file (fewer if the seed is smaller).  Only those rows are
+    read from disk.
+
+    Parameters
+    ----------
+    filename : (string) name of the '.bin' file
+
+    nr : the maximum number of rows to read
+
+    nc : the maximum number of columns to read
+    """
+    file_nr, file_nc, words = open_bin(filename)
+    nr = min(nr, file_nr)
+    nc = min(nc, file_nc)
+    part = BitWorld(nr, nc, np.array(words[:nr, :(nc + 63)//64],
+                                     dtype=np.uint64))
+    return part.to_array().astype(int)
+
+
+def write_bin(filename, w):
+    """
+    Writes the world w to a binary seed file
+
+    Parameters
+    ----------
+    filename : (string) name of the '.bin' file to write
+
+    w : a world matrix (2-d array of 0s and 1s) or a BitWorld
+    """
+    if not isinstance(w, BitWorld):
+        w = BitWorld.from_array(w)
+    with open(filename, 'wb') as fid:
+        fid.write(MAGIC)
+        fid.write(np.array([w.nr, w.nc], dtype='<u8').tobytes())
+        fid.write(w.words.astype('<u8').tobytes())
+
+
+def load_bit_world(filename, nr, nc):
+    """
+    Returns a new nr-by-nc BitWorld with a seed file in its top-left corner,
+    padded with dead cells if the seed is smaller
+
+    A binary seed is copied word by word from the memory-mapped file and a
+    plain text seed is read one line at a time, so the world matrix is never
+    built for those.
+
+    Parameters
+    ----------
+    filename : (string) name of a '.txt', '.rle', '.cells' or '.bin' seed
+
+    nr : number of rows of the world
+
+    nc : number of columns of the world
+    """
+    if filename.endswith('.bin'):
+        file_nr, file_nc, words = open_bin(filename)
+        world = BitWorld(nr, nc)
+        rows = min(nr, file_nr)
+        cols = min(nc, file_nc)
+        nw = (cols + 63)//64
+        world.words[:rows, :nw] = words[:rows, :nw]
+        if cols % 64 != 0:
+            #clear the bits past the last column that is kept
+            world.words[:rows, nw - 1] &= np.uint64((1 << (cols % 64)) - 1)
+        return world
+    if filename.endswith('.rle') or filename.endswith('.cells'):
+        seed = read_seed(filename, nr, nc)
+        world = BitWorld(nr, nc)
+        world.words[:seed.shape[0]] = pack_rows(seed, world.words.shape[1])
+        return world
+    return BitWorld.load(filename, nr, nc)
+
+
+def convert_seed(source, target):
+    """
+    Converts a seed file to another format, chosen by the extension of
+    target: '.bin' for a binary seed, otherwise a plain text seed
+
+    Parameters
+    ----------
+    source : (string) name of a '.txt', '.rle', '.cells' or '.bin' seed
+
+    target : (string) name of the file to write
+    """
+    if source.endswith('.bin'):
+        nr, nc, _ = open_bin(source)
+    elif source.endswith('.rle'):
+        nr, nc = read_rle(source).shape
+    elif source.endswith('.cells'):
+        nr, nc = read_cells(source).shape
+    else:
+        #size of a plain text seed: number of data lines and of values
+        nr = 0
+        nc = 0
+        with open(source, 'r') as fid:
+            for line in fid:
+                values = line.split('#')[0].split()
+                if values != []:
+                    nr += 1
+                    nc = max(nc, len(values))
+    world = load_bit_world(source, nr, nc)
+    if target.endswith('.bin'):
+        write_bin(target, world)
+    else:
+        world.save(target, f'converted from {source}')
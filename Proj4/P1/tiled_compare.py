@@ -0,0 +1,72 @@
+# tiled_compare.py
+"""
+Script to measure how the multi-core TiledLife scales with the number of
+worker processes, from 1 to the number of cores
+
+First checks that TiledLife gives the same worlds as the vectorized function
+without the extra-life-rule, and the same worlds for any number of workers
+with it.  Then times a few generations of a big random world for each number
+of workers and plots the speedup.
+"""
+import matplotlib.pyplot as plt
+import numpy as np
+import os
+import time
+from game_of_life import create_world, one_generation_later_vec
+from tiled_life import TiledLife
+
+if __name__ == "__main__":
+    max_workers = os.cpu_count()
+
+    # Equivalence checks on a small world with small bands
+    w0 = create_world(300, 200, 'random', np.random.default_rng(1112))
+    w = w0.copy()
+    tiled = TiledLife(w0, workers=2, band_rows=16)
+    for g in range(10):
+        w = one_generation_later_vec(w, False)
+        tiled.one_generation_later(False)
+    assert np.array_equal(w, tiled.to_array())
+    tiled.close()
+
+    results = []
+    for workers in [1, 2, 3]:
+        tiled = TiledLife(w0, workers=workers, band_rows=16, seed=7)
+        for g in range(10):
+            tiled.one_generation_later(True)
+        results.append(tiled.to_array())
+        tiled.close()
+    assert np.array_equal(results[0], results[1])
+    assert np.array_equal(results[0], results[2])
+    print('TiledLife gives the same worlds with 1, 2 and 3 workers')
+
+    # Scaling: time per generation of a big world for 1 to max_workers
+    size = 4000
+    num_gens = 10
+    w0 = create_world(size, size, 'random', np.random.default_rng(1112))
+
+    tstart = time.time()
+    w = w0
+    for g in range(num_gens):
+        w = one_generation_later_vec(w, True)
+    time_vec = (time.time() - tstart)/num_gens
+    print(f'vectorized, 1 process: {time_vec:8.4f} s per generation')
+
+    workers = np.arange(1, max_workers + 1)
+    time_tiled = np.zeros(len(workers))
+    for b in range(len(workers)):
+        tiled = TiledLife(w0, workers=workers[b])
+        tstart = time.time()
+        for g in range(num_gens):
+            tiled.one_generation_later(True)
+        time_tiled[b] = (time.time() - tstart)/num_gens
+        tiled.close()
+        print(f'TiledLife, {workers[b]:2d} workers: {time_tiled[b]:8.4f} s',
+              f'per generation, speedup {time_tiled[0]/time_tiled[b]:5.2f}')
+
+    # Plot speedup vs number of workers, with the ideal linear speedup
+    plt.plot(workers, time_tiled[0]/time_tiled, 'b-o', workers, workers, 'k--')
+    plt.title(f'TiledLife speedup on a {size} x {size} world')
+    plt.xlabel('Number of worker processes')
+    plt.ylabel('Speedup over 1 worker')
+    plt.legend(['TiledLife', 'Ideal'])
+    plt.show()
@@ -0,0 +1,137 @@
+# tiled_life.py
+"""
+Multi-core Game of Life for Project 4
+
+The world is split into bands of rows.  Each generation, a pool of worker
+processes computes the bands in parallel.  The world lives in two buffers of
+shared memory (multiprocessing.shared_memory), one for the current
+generation and one for the next: a worker reads its band plus the one-row
+halos above and below straight from the current buffer, and writes its rows
+of the next buffer in place.  The buffers then swap roles, so no world is
+ever copied between processes.
+
+The extra-life-rule uses a separate random generator per band, seeded from
+(seed, generation, band), and the bands do not depend on the number of
+workers, so a run gives the same worlds with any number of workers.
+"""
+import numpy as np
+from multiprocessing import Pool, shared_memory
+from life_rules import count_neighbors, apply_rules
+
+BAND_ROWS = 256  # rows per band
+
+
+#shared buffers, as seen from a worker process
+_buffers = []
+
+
+def _attach(names, shape):
+    """
+    Initializer of the worker processes: attaches the two shared buffers
+    """
+    for name in names:
+        shm = shared_memory.SharedMemory(name=name)
+        _buffers.append((shm, np.ndarray(shape, dtype=np.uint8,
+                                         buffer=shm.buf)))
+
+
+def _step_band(task):
+    """
+    Computes one band of the next generation.  task is the tuple
+    (r0, r1, src, add_rule, seed, generation, band): rows r0 to r1-1 of the
+    world are read from buffer src and written to the other buffer.
+    """
+    r0, r1, src, add_rule, seed, generation, band = task
+    #row i of the world is row i+1 of a buffer; rows 0 and nr+1 are dead
+    block = _buffers[src][1][r0:r1 + 2]
+    counts = count_neighbors(block)[1:-1]
+    rng = np.random.default_rng([seed, generation, band])
+    new = apply_rules(block[1:-1], counts, add_rule, rng)
+    _buffers[1 - src][1][r0 + 1:r1 + 1] = new
+
+
+class TiledLife:
+    """
+    A TiledLife is a Game of Life world stepped by a pool of worker
+    processes over shared memory.  Call close() when done with it.
+
+    Attributes
+    ----------
+    nr : int
+        number of rows of the world
+    nc : int
+        number of columns of the world
+    generation : int
+        number of generations computed so far
+    """
+
+    def __init__(self, w, workers=None, band_rows=BAND_ROWS, seed=None):
+        """
+        Initializes a TiledLife object and starts its worker processes
+
+        Parameters
+        ----------
+        w : the world matrix, a 2-d array of 0s and 1s
+
+        workers : number of worker processes.  Default: None, one per core
+
+        band_rows : number of rows per band.  Default: BAND_ROWS
+
+        seed : (int) seed of the random generators of the extra-life-rule.
+               Default: None, a random seed
+        """
+        self.nr, self.nc = np.shape(w)
+        self.generation = 0
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
+        self.seed = seed
+        self._bands = [(r0, min(r0 + band_rows, self.nr))
+                       for r0 in range(0, self.nr, band_rows)]
+        shape = (self.nr + 2, self.nc)
+        self._shms = [shared_memory.SharedMemory(create=True,
+                                                 size=(self.nr + 2)*self.nc)
+                      for _ in range(2)]
+        self._buffers = [np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+                         for shm in self._shms]
+        for b in self._buffers:
+            b[:] = 0
+        self._buffers[0][1:-1] = np.asarray(w) == 1
+        self._src = 0
+        self._pool = Pool(workers, initializer=_attach,
+                          initargs=([shm.name for shm in self._shms], shape))
+
+
+    def one_generation_later(self, add_rule):
+        """
+        Advances self ONE generation in place according to the rules of the
+        game of life and returns self
+
+        Parameter add_rule: (bool) If True, apply extra-life-rule;
+            otherwise do not apply extra-life-rule.
+        """
+        tasks = [(r0, r1, self._src, add_rule, self.seed, self.generation, b)
+                 for b, (r0, r1) in enumerate(self._bands)]
+        self._pool.map(_step_band, tasks)
+        self._src = 1 - self._src
+        self.generation += 1
+        return self
+
+
+    def to_array(self):
+        """
+        Returns the world matrix (a 2-d float array of 0s and 1s) of self
+        """
+        return self._buffers[self._src][1:-1].astype(float)
+
+
+    def close(self):
+        """
+        Stops the worker processes and frees the shared memory
+        """
+        self._pool.close()
+        self._pool.join()
+        self._buffers = []
+        for shm in self._shms:
+            shm.close()
+            shm.unlink()
+        self._shms = []
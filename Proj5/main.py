@@ -10,68 +10,22 @@ this once in a session (unless you restart the kernel).
 
 from robot import Robot
 from item import Item
-import numpy as np
+from scenario import load_scenario, create_objects
 import matplotlib.pyplot as plt
 
 
 def run_robots(data_filename):
     """
     Create an allocation of robots to pickup items given a data file in the
-    necessary format.
+    necessary format: a room file, or a binary scenario file (.npz) made by
+    scenario.convert_room.
     :param data_filename:
     """
-    with open(data_filename, 'r') as fid:
-        # Process the first line of the file
-        line = fid.readline()  
-        sim_info = line.strip().split(',')
-        sim_time = int(sim_info[0])
-        horiz_dim = float(sim_info[1])
-        vert_dim = float(sim_info[2])
-        room_size = np.array([horiz_dim, vert_dim])
-
-        # Process the remaining lines of the file
-        
-        ##############################################################
-        # TODO
-        # TASK 1: Modify the code below to create a list of Robots and
-        #         a list of Items.
-        ##############################################################
-        robots = []  # list of robots
-        items = []   # list of items
-        for line in fid:
-            # split `line` into a list of strings, with comma as separator   
-            tokens = line.strip().split(',')
-            
-            if tokens[0]=='Robot': #this means the line gives data for a robot
-                #remove the brackets from the strings obtained from the file
-                #and obtain integers from the results
-                x_loc_str=tokens[3].strip(" [")
-                y_loc_str=tokens[4].strip(" ]")
-                x_loc_int=int(x_loc_str)
-                y_loc_int=int(y_loc_str)
-                robots.append(Robot(int(tokens[1]),float(tokens[2]),\
-                [x_loc_int,y_loc_int],sim_time)) #appends a new instance of
-                                                 #Robot to list robots
-            else: #this means the line gives data for an item
-                #remove the brackets from the strings obtained from the file
-                #and obtain integers from the results
-                x_loc_str=tokens[5].strip(" [")
-                y_loc_str=tokens[6].strip(" ]")
-                x_loc_int=int(x_loc_str)
-                y_loc_int=int(y_loc_str)
-                items.append(Item(int(tokens[1]), tokens[2], float(tokens[3]),\
-                int(tokens[4]),int(tokens[7]),[x_loc_int,y_loc_int])) #appends
-                                                                      #a new
-                                                                      #instance
-                                                                      #of Robot
-                                                                      #to list
-                                                                      #robots
-            
-                
-        ##############################################################
-        # End of TASK 1
-        ##############################################################
-   
+    scenario = load_scenario(data_filename)
+    sim_time = scenario.sim_time
+    room_size = scenario.room_size
+    robots, items = create_objects(scenario, Robot, Item)
+
     # Do a task allocation
     allocated_robots, items_remaining = simple_allocation(robots, items)
 
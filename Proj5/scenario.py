@@ -0,0 +1,224 @@
+# scenario.py
+"""
+Loading of robot task allocation scenarios (room files) for Projects 5 and 6
+
+A room file has a first line "sim_time, width, height" followed by one
+record per line, in any order:
+    Robot, id, max_weight, [x,y]
+    FastRobot, id, max_weight, [x,y], speed_multiplier
+    LimbedRobot, id, max_weight, [x,y], slowdown_multiplier, max_payload, num_arms
+    Item, id, name, weight, arms_required, [x,y], duration
+
+read_room reads all the records of each kind at once into columns (NumPy
+arrays) instead of parsing one line at a time.  A scenario can also be saved
+to and loaded from a compact binary .npz file (see save_scenario), which
+loads millions of records in a fraction of a second; convert_room converts a
+room file to that format.  create_objects then makes the Robot and Item
+objects, in the order of the records in the file.
+
+This is the one copy of the loader: Proj6/P1/scenario.py loads this file
+and exports its names, so main.py and main6.py share it.
+"""
+
+import io
+import numpy as np
+
+# kinds of robot records, in the order of their codes in robots['kind']
+ROBOT_KINDS = ['Robot', 'FastRobot', 'LimbedRobot']
+
+# max_payload of a LimbedRobot that takes the random default (outside the
+# values of real data, which may be 0)
+DEFAULT_PAYLOAD = -1
+
+
+class Scenario:
+    """
+    A Scenario holds the data of a room file in columns.
+
+    Attributes
+    ----------
+    sim_time : int
+        number of time steps of the simulation
+    room_size : numpy array
+        length 2 array: the width and the height of the room
+    robots : dict
+        columns of the robot records, all arrays of the same length, in the
+        order of the records in the file:
+        'kind' (index in ROBOT_KINDS), 'id', 'max_weight', 'x', 'y',
+        'speed' (speed or slowdown multiplier, NaN for a Robot, or for a
+        FastRobot with the random default speed), 'max_payload' and
+        'num_arms' (0 unless a LimbedRobot; a max_payload of
+        DEFAULT_PAYLOAD, -1, for a LimbedRobot means the random default)
+    items : dict
+        columns of the item records, in the order of the records in the file:
+        'id', 'name', 'weight', 'arms', 'x', 'y', 'duration'
+    """
+
+    def __init__(self, sim_time, room_size, robots, items):
+        """
+        Initializes a Scenario object from its attributes
+        """
+        self.sim_time = sim_time
+        self.room_size = np.asarray(room_size, dtype=float)
+        self.robots = robots
+        self.items = items
+
+
+def _coords(values):
+    """
+    Returns the float array `values` as an int array if all the values are
+    whole numbers
+    """
+    if np.all(values == np.round(values)):
+        return values.astype(np.int64)
+    return values
+
+
+def _columns(lines, kinds, kind, usecols, dtype=float):
+    """
+    Returns (rows, columns): the indices in `lines` of the records of `kind`,
+    and a len(rows)-by-len(usecols) array of the fields `usecols` of these
+    records (the kind is field 0), all read at once by np.loadtxt.
+    kinds[k] is the kind of the record lines[k].
+    """
+    rows = [k for k in range(len(kinds)) if kinds[k] == kind]
+    if not rows:
+        return np.array(rows, dtype=np.int64), np.empty((0, len(usecols)),
+                                                        dtype=dtype)
+    block = io.StringIO('\n'.join([lines[k] for k in rows]))
+    columns = np.loadtxt(block, delimiter=',', usecols=usecols, dtype=dtype,
+                         ndmin=2)
+    return np.array(rows, dtype=np.int64), columns
+
+
+def read_room(data_filename):
+    """
+    Returns the `Scenario` of the room file `data_filename`
+    """
+    with open(data_filename, 'r') as fid:
+        sim_info = fid.readline().strip().split(',')
+        text = fid.read()
+    sim_time = int(sim_info[0])
+    room_size = [float(sim_info[1]), float(sim_info[2])]
+    lines = [line for line in
+             text.replace('[', '').replace(']', '').splitlines()
+             if line.strip()]
+    kinds = [line.split(',', 1)[0].strip() for line in lines]
+
+    # robots: each kind in bulk, then merged back into file order.
+    # Fields: id, max_weight, x, y, then speed, max_payload, num_arms
+    rows = []
+    columns = []
+    for code in range(len(ROBOT_KINDS)):
+        num_fields = [4, 5, 7][code]
+        kind_rows, c = _columns(lines, kinds, ROBOT_KINDS[code],
+                                range(1, num_fields + 1))
+        full = np.zeros((len(kind_rows), 8))
+        full[:, 0] = code
+        full[:, 1:num_fields + 1] = c
+        if code == 0:
+            full[:, 5] = np.nan
+        rows.append(kind_rows)
+        columns.append(full)
+    order = np.argsort(np.concatenate(rows), kind='stable')
+    c = np.concatenate(columns)[order]
+    robots = {'kind': c[:, 0].astype(np.int64),
+              'id': c[:, 1].astype(np.int64),
+              'max_weight': c[:, 2],
+              'x': _coords(c[:, 3]),
+              'y': _coords(c[:, 4]),
+              'speed': c[:, 5],
+              'max_payload': c[:, 6].astype(np.int64),
+              'num_arms': c[:, 7].astype(np.int64)}
+
+    # items. Fields: id, name, weight, arms_required, x, y, duration
+    _, c = _columns(lines, kinds, 'Item', (1, 3, 4, 5, 6, 7))
+    _, names = _columns(lines, kinds, 'Item', (2,), str)
+    items = {'id': c[:, 0].astype(np.int64),
+             'name': np.char.strip(names[:, 0]),
+             'weight': c[:, 1],
+             'arms': c[:, 2].astype(np.int64),
+             'x': _coords(c[:, 3]),
+             'y': _coords(c[:, 4]),
+             'duration': c[:, 5].astype(np.int64)}
+    return Scenario(sim_time, room_size, robots, items)
+
+
+def save_scenario(filename, scenario):
+    """
+    Saves `scenario` to the binary file `filename` (.npz), one array per
+    column
+    """
+    arrays = {'sim_time': np.array(scenario.sim_time),
+              'room_size': scenario.room_size}
+    for key, value in scenario.robots.items():
+        arrays['robot_' + key] = value
+    for key, value in scenario.items.items():
+        arrays['item_' + key] = value
+    np.savez(filename, **arrays)
+
+
+def load_scenario(filename):
+    """
+    Returns the `Scenario` in `filename`: a binary file saved by
+    save_scenario if the name ends in .npz, otherwise a room file
+    """
+    if not filename.endswith('.npz'):
+        return read_room(filename)
+    with np.load(filename, allow_pickle=False) as data:
+        robots = {key[6:]: data[key] for key in data.files
+                  if key.startswith('robot_')}
+        items = {key[5:]: data[key] for key in data.files
+                 if key.startswith('item_')}
+        return Scenario(int(data['sim_time']), data['room_size'],
+                        robots, items)
+
+
+def convert_room(data_filename, npz_filename):
+    """
+    Converts the room file `data_filename` to the binary file `npz_filename`
+    """
+    save_scenario(npz_filename, read_room(data_filename))
+
+
+def create_objects(scenario, Robot, Item, FastRobot=None, LimbedRobot=None):
+    """
+    Returns (robots, items), the lists of robot and item objects of
+    `scenario`, in the order of the records in the file
+
+    Parameters
+    ----------
+    scenario : a `Scenario`
+    Robot, Item, FastRobot, LimbedRobot : the classes to create.  A project
+        without FastRobot or LimbedRobot leaves them None; a scenario with
+        such robots then raises a ValueError.
+    """
+    classes = [Robot, FastRobot, LimbedRobot]
+    r = scenario.robots
+    robots = []
+    for kind, id_, max_weight, x, y, speed, max_payload, num_arms in zip(
+            r['kind'].tolist(), r['id'].tolist(), r['max_weight'].tolist(),
+            r['x'].tolist(), r['y'].tolist(), r['speed'].tolist(),
+            r['max_payload'].tolist(), r['num_arms'].tolist()):
+        if classes[kind] is None:
+            raise ValueError(f'{ROBOT_KINDS[kind]} is not supported')
+        loc = [x, y]
+        if kind == 0:
+            robots.append(Robot(id_, max_weight, loc, scenario.sim_time))
+        elif kind == 1:
+            #a NaN speed leaves the random default of FastRobot
+            robots.append(FastRobot(id_, max_weight, loc, scenario.sim_time,
+                                    None if speed != speed else speed))
+        else:
+            #DEFAULT_PAYLOAD leaves the random default of LimbedRobot
+            robots.append(LimbedRobot(id_, max_weight, loc,
+                                      scenario.sim_time, num_arms, speed,
+                                      None if max_payload == DEFAULT_PAYLOAD
+                                      else max_payload))
+    i = scenario.items
+    items = [Item(id_, name, weight, arms, duration, [x, y])
+             for id_, name, weight, arms, x, y, duration in zip(
+                 i['id'].tolist(), i['name'].tolist(), i['weight'].tolist(),
+                 i['arms'].tolist(), i['x'].tolist(), i['y'].tolist(),
+                 i['duration'].tolist())]
+    return robots, items
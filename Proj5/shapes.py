@@ -3,11 +3,53 @@ Functions to draw rectangle, disk, star
 
 The shape is added to the current plot if a figure window is active.  Otherwise
 a new figure window will open.
+
+The vertices of the unit disk and star are computed once per number of
+vertices and kept in a cache.  draw_rects and draw_disks draw many shapes
+with one collection instead of one plt.fill per shape.
 """
 
 
 import matplotlib.pyplot as plt 
 import numpy as np
+from matplotlib.collections import PolyCollection
+
+_unit_shapes = {}  # (shape, number of vertices) -> n-by-2 array of vertices
+
+
+def unit_shape(shape, n=100):
+    """
+    Returns the n-by-2 array of the vertices of a unit shape, computed on
+    the first call and then taken from the cache.  Do not modify it.
+
+    Parameters:
+        shape (str): 'disk' (n points on the circle of radius 1 centered at
+            the origin), 'star' (the n = 2*points vertices of the star of
+            radius 1 centered at the origin) or 'rect' (the square with lower
+            left corner at the origin and side 1; n is 4)
+        n (int): number of vertices.  Default: 100
+    """
+    key = (shape, n)
+    if key not in _unit_shapes:
+        if shape == 'rect':
+            vertices = np.array([[0., 0.], [1., 0.], [1., 1.], [0., 1.]])
+        else:
+            if shape == 'disk':
+                theta = np.linspace(0, 2*np.pi, n)
+                radius = np.ones(n)
+            elif shape == 'star':
+                points = n//2
+                theta = (2*np.arange(n) - 1)*np.pi/n
+                #outer vertices at radius 1, inner vertices in between
+                radius = np.where(np.arange(n)%2 == 1, 1,
+                                  1/(2*(1 + np.sin(np.pi/(points*2)))))
+            else:
+                raise ValueError(f'unknown shape {shape}')
+            vertices = np.column_stack((radius*np.cos(theta),
+                                        radius*np.sin(theta)))
+        vertices.flags.writeable = False
+        _unit_shapes[key] = vertices
+    return _unit_shapes[key]
 
 
 def draw_rect(a, b, w, h, c):
@@ -42,10 +84,8 @@ def draw_disk(xc, yc, r, c):
         r (float): The radius of the disk
         c (str): The color of the disk
     """
-    theta= np.linspace(0, 2*np.pi, 100)
-    cosines= np.cos(theta)
-    sines= np.sin(theta)
-    plt.fill(xc + r*cosines, yc + r*sines, color=c)
+    disk= unit_shape('disk')
+    plt.fill(xc + r*disk[:, 0], yc + r*disk[:, 1], color=c)
     
     
 def draw_star(xc, yc, r, c):
@@ -63,18 +103,60 @@ def draw_star(xc, yc, r, c):
         c (str): The color of the star
     """
     n= 5  # number of points of the star
-    ri= r/(2*(1+np.sin(np.pi/(n*2))))  # radius of the inner 5 vertices
-    x= np.zeros(n*2)
-    y= np.zeros(n*2)
-    for k in range(n*2):
-        theta= (2*k-1)*np.pi/(n*2)
-        if k%2 == 1:
-            x[k]= xc + r*np.cos(theta)
-            y[k]= yc + r*np.sin(theta)
-        else:
-            x[k]= xc + ri*np.cos(theta)
-            y[k]= yc + ri*np.sin(theta)     
-    plt.fill(x, y, color=c)
+    star= unit_shape('star', n*2)
+    plt.fill(xc + r*star[:, 0], yc + r*star[:, 1], color=c)
+
+
+def _draw_collection(vertices, c):
+    """
+    Adds the shapes with the given vertices (a k-by-n-by-2 array) to the
+    plot as one collection of color(s) c, and returns the collection
+    """
+    collection= PolyCollection(vertices, facecolors=c, edgecolors=c)
+    ax= plt.gca()
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def draw_rects(a, b, w, h, c):
+    """
+    Adds rectangles to the plot, all in one collection, and returns it.
+
+    Rectangle k is the rectangle of draw_rect(a[k], b[k], w[k], h[k], c[k]).
+
+    Parameters:
+        a (array): The x-coordinates of the lower left corners
+        b (array): The y-coordinates of the lower left corners
+        w (array or float): The widths of the rectangles
+        h (array or float): The heights of the rectangles
+        c (str or list): The color of all the rectangles, or a list of colors
+    """
+    a, b, w, h= np.broadcast_arrays(*[np.asarray(v, dtype=float)
+                                      for v in (a, b, w, h)])
+    rect= unit_shape('rect', 4)
+    corners= np.stack((a, b), axis=-1).reshape(-1, 1, 2)
+    sizes= np.stack((w, h), axis=-1).reshape(-1, 1, 2)
+    return _draw_collection(corners + sizes*rect, c)
+
+
+def draw_disks(xc, yc, r, c):
+    """
+    Adds circular disks to the plot, all in one collection, and returns it.
+
+    Disk k is the disk of draw_disk(xc[k], yc[k], r[k], c[k]).
+
+    Parameters:
+        xc (array): The x-coordinates of the centers of the disks
+        yc (array): The y-coordinates of the centers of the disks
+        r (array or float): The radii of the disks
+        c (str or list): The color of all the disks, or a list of colors
+    """
+    xc, yc, r= np.broadcast_arrays(*[np.asarray(v, dtype=float)
+                                     for v in (xc, yc, r)])
+    disk= unit_shape('disk')
+    centers= np.stack((xc, yc), axis=-1).reshape(-1, 1, 2)
+    return _draw_collection(centers + r.reshape(-1, 1, 1)*disk, c)
            
     
     
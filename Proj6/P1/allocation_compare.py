@@ -0,0 +1,95 @@
+# allocation_compare.py
+"""
+Script to compare the allocation algorithms of Project 6 on generated rooms
+
+For rooms with more and more robots (and twice as many items), times
+simple_allocation, create_allocation, create_allocation_indexed,
+assignment_allocation and best_first_allocation, and counts the items each
+one gets picked up.
+"""
+import copy
+import matplotlib.pyplot as plt
+import numpy as np
+import time
+from robot import Robot, FastRobot, LimbedRobot
+from item import Item
+from main6 import (simple_allocation, create_allocation,
+                   create_allocation_indexed)
+from assignment import assignment_allocation
+from best_first import best_first_allocation
+
+
+def random_room(num_robots, num_items, sim_time, size, rng):
+    """
+    Returns (robots, items), lists of random robots of the three kinds and
+    random items in a size-by-size room, for a simulation of sim_time steps
+
+    Parameter rng: a numpy.random.Generator
+    """
+    robots = []
+    for k in range(num_robots):
+        loc = [int(rng.integers(size)), int(rng.integers(size))]
+        max_weight = float(rng.integers(1, 10))
+        kind = k % 3
+        if kind == 0:
+            robots.append(Robot(k, max_weight, loc, sim_time))
+        elif kind == 1:
+            robots.append(FastRobot(k, max_weight, loc, sim_time,
+                                    float(rng.integers(1, 7))))
+        else:
+            robots.append(LimbedRobot(k, max_weight, loc, sim_time,
+                                      int(rng.integers(0, 4)),
+                                      float(rng.choice([0.25, 0.5, 0.75])),
+                                      int(rng.integers(2, 7))))
+    items = []
+    for k in range(num_items):
+        loc = [int(rng.integers(size)), int(rng.integers(size))]
+        items.append(Item(k, f'item{k}', float(rng.integers(1, 40)),
+                          int(rng.integers(0, 3)), int(rng.integers(1, 5)),
+                          loc))
+    return robots, items
+
+
+if __name__ == "__main__":
+    allocators = [simple_allocation, create_allocation,
+                  create_allocation_indexed, assignment_allocation,
+                  best_first_allocation]
+    num_robots = np.array([10, 30, 100, 300])
+    rng = np.random.default_rng(1112)
+
+    times = np.zeros((len(allocators), len(num_robots)))
+    served = np.zeros((len(allocators), len(num_robots)), dtype=int)
+    for b in range(len(num_robots)):
+        n = num_robots[b]
+        size = int(10*np.sqrt(n))  # about the same density of robots
+        room = random_room(n, 2*n, 4*size, size, rng)
+        for a in range(len(allocators)):
+            robots, items = copy.deepcopy(room)
+            tstart = time.time()
+            _, items_remaining = allocators[a](robots, items)
+            times[a, b] = time.time() - tstart
+            served[a, b] = len(items) - len(items_remaining)
+        print(f'{n:4d} robots, {2*n:4d} items:')
+        for a in range(len(allocators)):
+            print(f'  {allocators[a].__name__:26s} {times[a, b]:9.4f} s,',
+                  f'{served[a, b]:4d} items picked up')
+
+    names = [f.__name__ for f in allocators]
+    styles = ['k-o', 'b-s', 'g-^', 'm-d', 'r-v']
+
+    plt.figure()
+    for a in range(len(allocators)):
+        plt.loglog(num_robots, times[a], styles[a])
+    plt.title('Time to allocate the items (2 items per robot)')
+    plt.xlabel('Number of robots')
+    plt.ylabel('Time (seconds)')
+    plt.legend(names)
+
+    plt.figure()
+    for a in range(len(allocators)):
+        plt.semilogx(num_robots, served[a]/(2*num_robots), styles[a])
+    plt.title('Fraction of the items picked up')
+    plt.xlabel('Number of robots')
+    plt.ylabel('Items picked up / items')
+    plt.legend(names)
+    plt.show()
@@ -0,0 +1,123 @@
+# assignment.py
+"""
+Allocation of item pickups to robots by optimal assignment
+
+Instead of giving the items to robots one item at a time, each round
+matches robots to items all at once: the cost of every (robot, item) pair is
+computed in one vectorized pass, and a linear assignment solver (the
+Hungarian algorithm, scipy.optimize.linear_sum_assignment) finds the
+matching of robots to items with the most pickups and, among those, the
+least total cost.  Every matched robot then picks its item, and the next
+round starts from the robots' new locations and times, until no robot can
+pick any item left.
+"""
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from fleet import Fleet
+
+
+def item_columns(items):
+    """
+    Returns a dict of arrays with the data of the items in `items` needed to
+    score pickups: 'loc' (n-by-2), 'duration', 'weight', 'arms' and 'free'
+    (True if the item is not already scheduled for pickup)
+
+    Parameter items: (list) list of `Item` references
+    """
+    locs = np.array([i.loc for i in items], dtype=float).reshape(-1, 2)
+    return {'loc': locs,
+            'duration': np.array([i.duration for i in items]),
+            'weight': np.array([i.weight for i in items], dtype=float),
+            'arms': np.array([i.arm_requirement for i in items], dtype=float),
+            'free': np.array([i.picked_window is None for i in items],
+                             dtype=bool)}
+
+
+def cost_matrix(robots, items, a=0.8, b=0.2, columns=None):
+    """
+    Returns (cost, feasible), two len(robots)-by-len(items) arrays:
+
+    cost : cost[k, j] is the objective a*time_needed + b*time_ratio of
+        robots[k] picking items[j], as in `create_allocation`
+    feasible : feasible[k, j] is True if robots[k].pick(items[j], False)
+        would return True: the robot can carry the item, has enough arms,
+        has the time to travel to it and pick it up, and the item is not
+        already scheduled for pickup
+
+    Parameters
+    ----------
+    robots : list or Fleet
+        list of `Robot` references, or a `Fleet` of them
+    items : list
+        list of `Item` references
+    a : weight for the time_needed objective.  Default: 0.8
+    b : weight for the time_ratio objective.  Default: 0.2
+    columns : the item_columns of the items, if already computed (then
+        `items` is not used).  Default: None
+    """
+    if columns is None:
+        columns = item_columns(items)
+    if not isinstance(robots, Fleet):
+        robots = Fleet.of(robots, attach=False)
+    return robots.cost_matrix(columns, a, b)
+
+
+def assignment_allocation(robots, items):
+    """
+    Allocate item pickups to robots, round by round, with an optimal
+    assignment of robots to items in each round.
+
+    Parameters
+        ----------
+        robots : list
+            non-empty list of unique `Robot` references
+        items : list
+            non-empty list of unique `Item` references
+
+    Algorithm:  In each round, compute `cost_matrix` for all robots and the
+    items left.  Solve the assignment problem on the robots and items that
+    have at least one feasible pair, with infeasible pairs given a cost
+    larger than any set of feasible pairs, so that the matching has as many
+    pickups as possible and then the least total objective.  Each robot
+    matched to a feasible item picks it.  Stop when no feasible pair is left.
+
+    Returns
+    -------
+    lisR : list
+        list of the `Robot`s that picked up `Item`s
+    lisI : list
+        list of remaining `Item`s that didn't get picked up
+    """
+    lisR = []
+    in_lisR = set()  # indices of the robots in lisR
+    shared = Fleet.attached(robots)
+    fleet = Fleet.of(robots)
+    try:
+        items_left = list(items)
+        while items_left:
+            cost, feasible = cost_matrix(fleet, items_left)
+            rows = np.flatnonzero(feasible.any(axis=1))
+            cols = np.flatnonzero(feasible.any(axis=0))
+            if len(rows) == 0:
+                break
+            cost = cost[np.ix_(rows, cols)]
+            feasible = feasible[np.ix_(rows, cols)]
+            big = cost[feasible].max()*min(cost.shape) + 1
+            matched_rows, matched_cols = linear_sum_assignment(
+                np.where(feasible, cost, big))
+            picked = set()
+            for k, j in zip(matched_rows, matched_cols):
+                if feasible[k, j]:
+                    robot = robots[rows[k]]
+                    robot.pick(items_left[cols[j]])
+                    picked.add(cols[j])
+                    if rows[k] not in in_lisR:
+                        in_lisR.add(rows[k])
+                        lisR.append(robot)
+            items_left = [items_left[j] for j in range(len(items_left))
+                          if j not in picked]
+        return lisR, items_left
+    finally:
+        if fleet is not shared:
+            fleet.release()
@@ -0,0 +1,106 @@
+# best_first.py
+"""
+Best-first allocation of item pickups to robots, with a heap of item scores
+
+`create_allocation` takes the items in list order and gives each one to
+the robot with the best objective 0.8*time_needed + 0.2*time_ratio.
+best_first_allocation uses the same objective but not the same order: it
+always makes next the pickup with the best objective over all the robots
+and all the items left, so it allocates differently (an item late in the
+list can go first, and to a robot create_allocation would have given an
+earlier item).  It is a different greedy allocator, not a faster
+create_allocation; `create_allocation_indexed` is the one that gives the
+same allocation as create_allocation with less work.
+
+All the (robot, item) pairs are scored once, in one vectorized pass, and a
+heap holds the best score of each item.  A pick changes the location and
+the remaining time of only the robot that picked, so after a pick only the
+pairs of that robot (one row of the score matrix) are scored again; scores
+that went out of date are found lazily, when they come to the top of the
+heap.  The score matrix takes O(R*I) memory and time to build for R robots
+and I items, and each pick takes O(R + I) more (a column to find the item's
+best robot, a row to score again), so the work is not near-linear in the
+number of pairs; the gain over scoring every pair again for every pick is
+in the rescoring, done in NumPy one robot at a time.
+"""
+
+import heapq
+import numpy as np
+from assignment import item_columns
+from fleet import Fleet
+
+
+def best_first_allocation(robots, items):
+    """
+    Allocate item pickups to robots, always making next the pickup with the
+    best objective 0.8*time_needed + 0.2*time_ratio of `create_allocation`
+    over all the robots and all the items left.  Unlike create_allocation,
+    items are not taken in list order, so the allocation differs.
+
+    Parameters
+        ----------
+        robots : list
+            non-empty list of unique `Robot` references
+        items : list
+            non-empty list of unique `Item` references
+
+    Algorithm:  Score all the pairs at once with `Fleet.cost_matrix`
+    (infeasible pairs score infinity) and push the best score of each item
+    on a heap.  Pop the best item: if that is still the score of its best
+    robot, the robot picks it; otherwise push the item back with its current
+    best score.  After a pick, the item's column is dropped and the robot's
+    row is scored again; an item whose best score that row improves is
+    pushed again.  Ties go to the item, then the robot, that comes first.
+    Stop when no feasible pair is left.
+
+    Returns
+    -------
+    lisR : list
+        list of the `Robot`s that picked up `Item`s
+    lisI : list
+        list of remaining `Item`s that didn't get picked up
+    """
+    shared = Fleet.attached(robots)
+    fleet = Fleet.of(robots)
+    try:
+        columns = item_columns(items)
+        cost, feasible = fleet.cost_matrix(columns)
+        cost[~feasible] = np.inf
+        best_robot = cost.argmin(axis=0)  # first robot with the best score
+        #the score last pushed for each item
+        best_score = cost[best_robot, np.arange(len(items))]
+        queue = [(best_score[j], j, best_robot[j]) for j in range(len(items))
+                 if best_score[j] < np.inf]
+        heapq.heapify(queue)
+
+        lisR = []
+        in_lisR = set()
+        while queue:
+            score, j, k = heapq.heappop(queue)
+            if not columns['free'][j]:
+                continue
+            b = cost[:, j].argmin()
+            if cost[b, j] == np.inf:
+                continue
+            if (cost[b, j], b) != (score, k):
+                best_score[j] = cost[b, j]
+                heapq.heappush(queue, (best_score[j], j, b))
+                continue
+            robot = robots[k]
+            robot.pick(items[j])
+            if k not in in_lisR:
+                in_lisR.add(k)
+                lisR.append(robot)
+            columns['free'][j] = False
+            cost[:, j] = np.inf
+            #score again only the pairs of the robot that picked
+            row, row_feasible = fleet.cost_matrix(columns, rows=[k])
+            cost[k] = np.where(row_feasible[0], row[0], np.inf)
+            for i in np.flatnonzero(cost[k] < best_score):
+                best_score[i] = cost[k, i]
+                heapq.heappush(queue, (best_score[i], i, k))
+        return lisR, [items[j] for j in range(len(items))
+                      if columns['free'][j]]
+    finally:
+        if fleet is not shared:
+            fleet.release()
@@ -0,0 +1,220 @@
+# fleet.py
+"""
+A fleet of robots stored as parallel NumPy arrays (a struct of arrays)
+
+The allocators score every robot against many items at once.  Asking each
+`Robot` object for its payload, arms, speed, location and time costs one
+Python call per robot per query; a `Fleet` keeps these values in one array
+per attribute, so that feasibility and travel-time queries over the whole
+fleet are single vectorized expressions.  The arrays are the only copy of
+these values: a robot attached to a fleet drops its own id, weight, time,
+speed, payload and arms attributes and its getters read its element of the
+fleet's arrays, so the `Robot`, `FastRobot` and `LimbedRobot` objects the
+rest of the code uses are views of the fleet.  A robot's timeline stays on
+the robot, which writes its new location and time to the fleet after each
+pick.  A robot is in at most one fleet at a time: `Fleet.of` reuses the
+fleet of a list of robots, and `release` gives the robots their attributes
+back; the allocators release the fleets they make before returning.
+"""
+
+import numpy as np
+from robot import travel_time_matrix
+
+
+class Fleet:
+    """
+    A `Fleet` holds the data of a list of robots in parallel arrays, robot k
+    of the list being element k of every array.  The arrays are the backing
+    store of the attached robots: write to them, not to the robots.
+
+    Instance attributes
+    -------------------
+    robots : list
+        the `Robot` references, in order
+    ids : int array of the robots' ids
+    max_weight : float array of the robots' `get_max_weight()`
+    payload_factor : int array of the robots' `get_payload_factor()`
+    num_arms : int array of the robots' `get_num_arms()`
+    speed : float array of the robots' `get_speed()` (speed or slowdown
+        multiplier, 1 for a `Robot`)
+    straight : bool array, True for robots that travel along the straight
+        line (`straight_line`)
+    total_time : int array of the robots' `get_total_time()`
+    position : n-by-2 float array of the robots' current locations
+        (`where_am_i()[0]`)
+    time : int array of the robots' current times (`where_am_i()[1]`)
+    """
+
+    def __init__(self, robots, attach=True):
+        """
+        Initializes a `Fleet` of the robots in the list `robots`.  If
+        `attach` is True (default), each robot is attached to the fleet (see
+        `Robot.attach`), which then stores its data; raises a ValueError if
+        one of them is already in a fleet.  Otherwise the fleet is a
+        snapshot of the robots, not updated by their picks.
+        """
+        self.robots = list(robots)
+        if attach:
+            for r in self.robots:
+                if r._fleet is not None:
+                    raise ValueError(f'Robot {r.get_id()} is already in a '
+                                     'fleet')
+        self.ids = np.array([r.get_id() for r in self.robots], dtype=np.int64)
+        self.max_weight = np.array([r.get_max_weight() for r in self.robots],
+                                   dtype=float)
+        self.payload_factor = np.array([r.get_payload_factor()
+                                        for r in self.robots], dtype=np.int64)
+        self.num_arms = np.array([r.get_num_arms() for r in self.robots],
+                                 dtype=np.int64)
+        self.speed = np.array([r.get_speed() for r in self.robots],
+                              dtype=float)
+        self.straight = np.array([r.straight_line for r in self.robots],
+                                 dtype=bool)
+        self.total_time = np.array([r.get_total_time() for r in self.robots],
+                                   dtype=np.int64)
+        self.position = np.zeros((len(self.robots), 2))
+        self.time = np.zeros(len(self.robots), dtype=np.int64)
+        for k in range(len(self.robots)):
+            self.update(k)
+            if attach:
+                self.robots[k].attach(self, k)
+
+
+    @staticmethod
+    def attached(robots):
+        """
+        Returns the `Fleet` the robots in the list `robots` are attached to,
+        if it holds exactly these robots in this order, or else None
+        """
+        fleet = robots[0]._fleet if len(robots) > 0 else None
+        if (fleet is not None and len(fleet) == len(robots)
+                and all(a is b for a, b in zip(fleet.robots, robots))):
+            return fleet
+        return None
+
+
+    @classmethod
+    def of(cls, robots, attach=True):
+        """
+        Returns the `Fleet` the robots in the list `robots` are attached to
+        (see `attached`), or else a new `Fleet(robots, attach)`.  A caller
+        that gets a new attached fleet should `release` it when done, so
+        that the robots can join another fleet.
+        """
+        fleet = cls.attached(robots)
+        if fleet is None:
+            fleet = cls(robots, attach)
+        return fleet
+
+
+    def release(self):
+        """
+        Detaches all the robots from the fleet (see `Robot.detach`), so that
+        they can join another one
+        """
+        for r in self.robots:
+            if r._fleet is self:
+                r.detach()
+
+
+    def __len__(self):
+        return len(self.robots)
+
+
+    def __getitem__(self, k):
+        return self.robots[k]
+
+
+    def __iter__(self):
+        return iter(self.robots)
+
+
+    def update(self, k):
+        """
+        Writes the current location and time of robot k (called by the
+        robot after each pick, as they come from its timeline)
+        """
+        loc, t = self.robots[k].where_am_i()
+        self.position[k] = loc
+        self.time[k] = t
+
+
+    def payload(self):
+        """
+        Returns a float array of the robots' `get_payload()`
+        """
+        return self.payload_factor*self.max_weight
+
+
+    def remaining(self):
+        """
+        Returns an int array of the time steps each robot has left
+        """
+        return self.total_time - self.time
+
+
+    def travel_times(self, locs, rows=None):
+        """
+        Returns an n-by-m int array whose element [k, j] is the
+        `travel_time` of robot k to locs[j]
+
+        Parameters
+        ----------
+        locs : list of m length 2 lists (or an m-by-2 array) of x-y
+            coordinates
+        rows : the indices of the robots to use (then n = len(rows)).
+            Default: None, all the robots
+        """
+        if rows is None:
+            rows = slice(None)
+        return travel_time_matrix(self.position[rows], self.speed[rows],
+                                  self.straight[rows], locs)
+
+
+    def feasible(self, columns, rows=None, time_needed=None):
+        """
+        Returns an n-by-m bool array whose element [k, j] is True if robot k
+        can pick item j now: it can carry the item, has enough arms, has the
+        time to travel to it and pick it up, and the item is not already
+        scheduled for pickup
+
+        Parameters
+        ----------
+        columns : the `item_columns` of the m items
+        rows : the indices of the robots to use.  Default: None, all
+        time_needed : the travel times plus the durations, if already
+            computed.  Default: None
+        """
+        if rows is None:
+            rows = slice(None)
+        if time_needed is None:
+            time_needed = (self.travel_times(columns['loc'], rows)
+                           + columns['duration'])
+        remaining = self.remaining()[rows]
+        return ((time_needed <= remaining[:, None])
+                & (self.payload()[rows][:, None] >= columns['weight'])
+                & (self.num_arms[rows][:, None] >= columns['arms'])
+                & columns['free'] & (remaining > 0)[:, None])
+
+
+    def cost_matrix(self, columns, a=0.8, b=0.2, rows=None):
+        """
+        Returns (cost, feasible), two n-by-m arrays: cost[k, j] is the
+        objective a*time_needed + b*time_ratio of robot k picking item j, as
+        in `create_allocation`, and feasible is as returned by `feasible`
+
+        Parameters
+        ----------
+        columns : the `item_columns` of the m items
+        a : weight for the time_needed objective.  Default: 0.8
+        b : weight for the time_ratio objective.  Default: 0.2
+        rows : the indices of the robots to use.  Default: None, all
+        """
+        if rows is None:
+            rows = slice(None)
+        time_needed = (self.travel_times(columns['loc'], rows)
+                       + columns['duration'])
+        feasible = self.feasible(columns, rows, time_needed)
+        remaining = self.remaining()[rows]
+        time_ratio = time_needed/np.where(remaining > 0, remaining, 1)[:, None]
+        return a*time_needed + b*time_ratio, feasible
@@ -1,9 +1,18 @@
 # interval.py
+import numpy as np
+
+
 class Interval:
     """
     An Interval has a left endpoint and a right endpoint.
+
+    An Interval has no instance dictionary (`__slots__`), so that the many
+    small Intervals made by picks take less memory and time.  Use an
+    `IntervalArray` for many intervals at once.
     """
 
+    __slots__ = ('left', 'right')
+
     def __init__(self, left=0, right=1):
         """
         Initializes an Interval object
@@ -76,3 +85,121 @@ class Interval:
         Returns a string representation of the interval
         """
         return f"Interval [{self.left:.2f}, {self.right:.2f}]"
+
+
+class IntervalArray:
+    """
+    An IntervalArray is a batch of intervals, stored as two NumPy arrays of
+    left and right endpoints, with the methods of `Interval` done on the
+    whole batch at once.
+
+    Attributes
+    ----------
+    left : numpy array of the left endpoints
+    right : numpy array of the right endpoints (same shape as left)
+    """
+
+    def __init__(self, left, right):
+        """
+        Initializes an IntervalArray object
+
+        Parameters:
+        -----------
+        left: (array_like) left endpoints
+
+        right: (array_like) right endpoints, same length as left.  Assume
+            right > left.
+        """
+        self.left = np.asarray(left)
+        self.right = np.asarray(right)
+
+
+    @classmethod
+    def from_intervals(cls, intervals):
+        """
+        Returns the IntervalArray of the list `intervals` of Intervals
+        """
+        return cls([i.left for i in intervals], [i.right for i in intervals])
+
+
+    def to_intervals(self):
+        """
+        Returns the list of the Intervals of the array
+        """
+        return [Interval(l, r) for l, r in zip(self.left.tolist(),
+                                               self.right.tolist())]
+
+
+    def __len__(self):
+        return len(self.left)
+
+
+    def __getitem__(self, k):
+        """
+        Returns the Interval number k if k is an integer, otherwise (a
+        slice, an index array or a bool mask) an IntervalArray
+        """
+        if np.ndim(k) == 0 and not isinstance(k, slice):
+            return Interval(self.left[k].item(), self.right[k].item())
+        return IntervalArray(self.left[k], self.right[k])
+
+
+    def get_width(self):
+        """
+        Returns the array of the widths of the intervals
+        """
+        return self.right - self.left
+
+
+    def shift(self, s):
+        """
+        Shifts the intervals by s units
+
+        Parameter: s, (numeric or array) amount shifted (can be negative),
+            one amount for all the intervals or one per interval
+        """
+        self.left = self.left + s
+        self.right = self.right + s
+
+
+    def is_in(self, other):
+        """
+        Returns a bool array, True where the interval is entirely in the
+        other interval
+
+        Parameter: other, an Interval (for all the intervals) or an
+            IntervalArray of the same length (interval by interval)
+        """
+        return (self.left >= other.left) & (self.right <= other.right)
+
+
+    def add(self, other):
+        """
+        Returns a new IntervalArray by adding intervals component-wise
+
+        Parameter: other, an Interval or an IntervalArray of the same length
+        """
+        return IntervalArray(self.left + other.left, self.right + other.right)
+
+
+    def overlap(self, other):
+        """
+        Returns (overlaps, mask): mask is a bool array, True where the
+        interval and the other interval overlap, and overlaps is the
+        IntervalArray of the overlapping intervals (meaningless where mask
+        is False)
+
+        Parameter: other, an Interval or an IntervalArray of the same length
+        """
+        left = np.maximum(self.left, other.left)
+        right = np.minimum(self.right, other.right)
+        return IntervalArray(left, right), right - left > 0
+
+
+    def __str__(self):
+        """
+        Returns a string representation of the intervals
+        """
+        return 'IntervalArray [' + ', '.join(
+            [f"[{l:.2f}, {r:.2f}]" for l, r in zip(self.left.tolist(),
+                                                   self.right.tolist())]) + ']'
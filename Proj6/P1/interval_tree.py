@@ -0,0 +1,315 @@
+# interval_tree.py
+"""
+Interval tree of `Interval`s, for occupancy and conflict queries
+
+A robot's `_occupied_periods` is a list of `Interval`s, and
+`Interval.overlap` compares only two of them, so asking which robots are
+busy at a time, or which picks overlap a time window, looks at every period
+of every robot.  An IntervalTree is a binary search tree of intervals
+ordered by their left endpoints, each node also holding the largest right
+endpoint in its subtree.  A query only goes down the subtrees that can hold
+an answer, so it takes about log n steps per interval found instead of n
+steps.  A tree is built in bulk from sorted intervals (perfectly balanced);
+intervals inserted later are kept balanced by rebuilding the subtree of the
+deepest unbalanced node (a scapegoat tree).
+
+Intervals are half-open here: [left, right) holds the times t with
+left <= t < right, so a period that ends when the next one starts does not
+overlap it, as with `Interval.overlap`.  An interval of width 0 holds no
+time, so it never overlaps anything, even an interval around it.
+"""
+
+import math
+from interval import Interval
+
+
+class _Node:
+    """
+    A node of an IntervalTree: an interval, its data, the two subtrees, the
+    largest right endpoint and the number of nodes of the subtree
+    """
+
+    def __init__(self, interval, data):
+        self.interval = interval
+        self.data = data
+        self.left = None
+        self.right = None
+        self.max_right = interval.right
+        self.size = 1
+
+
+    def update(self):
+        """
+        Computes `max_right` and `size` again from the children
+        """
+        self.max_right = self.interval.right
+        self.size = 1
+        for child in (self.left, self.right):
+            if child is not None:
+                self.max_right = max(self.max_right, child.max_right)
+                self.size += child.size
+
+
+class IntervalTree:
+    """
+    An IntervalTree holds (Interval, data) pairs, where data is anything the
+    interval is about (e.g., the robot that is busy), and answers stabbing,
+    overlap and gap queries.
+
+    Class attribute
+    ---------------
+    alpha : float
+        balance factor in (1/2, 1): after an insertion, a subtree where one
+        child has more than alpha times the nodes of the whole subtree is
+        rebuilt if the new node is too deep
+    """
+
+    alpha = 2/3
+
+
+    def __init__(self, intervals=()):
+        """
+        Builds an IntervalTree of `intervals`, a list of `Interval`s or of
+        (Interval, data) pairs (data is None for a lone Interval)
+        """
+        pairs = [p if isinstance(p, tuple) else (p, None) for p in intervals]
+        pairs.sort(key=lambda p: (p[0].left, p[0].right))
+        self._root = self._build([_Node(i, d) for i, d in pairs])
+
+
+    def _build(self, nodes, lo=0, hi=None):
+        """
+        Returns the root of a balanced subtree of nodes[lo:hi], where `nodes`
+        is a list of nodes sorted by left endpoint
+        """
+        if hi is None:
+            hi = len(nodes)
+        if lo == hi:
+            return None
+        mid = (lo + hi)//2
+        node = nodes[mid]
+        node.left = self._build(nodes, lo, mid) if lo < mid else None
+        node.right = self._build(nodes, mid + 1, hi) if mid + 1 < hi else None
+        node.update()
+        return node
+
+
+    def __len__(self):
+        return 0 if self._root is None else self._root.size
+
+
+    def __iter__(self):
+        """
+        Iterates over the (Interval, data) pairs by left endpoint
+        """
+        for node in self._nodes(self._root):
+            yield node.interval, node.data
+
+
+    def insert(self, interval, data=None):
+        """
+        Adds the `Interval` `interval` with its `data` to the tree
+        """
+        new = _Node(interval, data)
+        if self._root is None:
+            self._root = new
+            return
+        path = []
+        node = self._root
+        while node is not None:
+            path.append(node)
+            node = node.left if interval.left < node.interval.left \
+                else node.right
+        if interval.left < path[-1].interval.left:
+            path[-1].left = new
+        else:
+            path[-1].right = new
+        for node in path:
+            node.size += 1
+            node.max_right = max(node.max_right, interval.right)
+
+        #too deep: rebuild the subtree of the deepest unbalanced ancestor
+        if len(path) > math.log(len(self), 1/self.alpha):
+            for k in range(len(path) - 1, -1, -1):
+                node = path[k]
+                if max(c.size for c in (node.left, node.right)
+                       if c is not None) > self.alpha*node.size:
+                    nodes = list(self._nodes(node))
+                    subtree = self._build(nodes)
+                    if k == 0:
+                        self._root = subtree
+                    elif path[k - 1].left is node:
+                        path[k - 1].left = subtree
+                    else:
+                        path[k - 1].right = subtree
+                    break
+
+
+    def _nodes(self, node):
+        """
+        Yields the nodes of the subtree of `node` by left endpoint
+        """
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            right = node.right
+            yield node
+            node = right
+
+
+    def _search(self, lo, hi, closed):
+        """
+        Returns the list of the (Interval, data) pairs with right > lo and
+        left < hi (left <= hi if `closed`), by left endpoint, leaving out
+        the intervals of width 0
+        """
+        found = []
+        stack = [(self._root, False)]
+        while stack:
+            node, visited = stack.pop()
+            if node is None or node.max_right <= lo:
+                continue
+            if visited:
+                found.append((node.interval, node.data))
+                continue
+            i = node.interval
+            if i.left < hi or (closed and i.left == hi):
+                #the right subtree only holds intervals starting after i
+                stack.append((node.right, False))
+                if i.right > lo and i.right > i.left:
+                    stack.append((node, True))
+            stack.append((node.left, False))
+        return found
+
+
+    def stab(self, t):
+        """
+        Returns the list of the (Interval, data) pairs of the intervals that
+        hold time `t` (left <= t < right), by left endpoint
+        """
+        return self._search(t, t, True)
+
+
+    def overlap(self, other):
+        """
+        Returns the list of the (Interval, data) pairs of the intervals that
+        overlap the `Interval` `other` (as by `Interval.overlap`), by left
+        endpoint
+        """
+        if other.right <= other.left:
+            return []
+        return self._search(other.left, other.right, False)
+
+
+    def gaps(self, start, end):
+        """
+        Returns the list of the `Interval`s of [start, end) that no interval
+        of the tree covers (the idle gaps), in order
+        """
+        gaps = []
+        t = start
+        for i, _ in self._search(start, end, False):
+            if i.left > t:
+                gaps.append(Interval(t, i.left))
+            t = max(t, i.right)
+        if end > t:
+            gaps.append(Interval(t, end))
+        return gaps
+
+
+    def find_gap(self, width, start, end):
+        """
+        Returns the earliest `Interval` of width `width` in [start, end)
+        that overlaps no interval of the tree, or None if there is none
+
+        Parameters
+        ----------
+        width : (number, positive) width of the interval to fit
+        start, end : (numbers) the time window to search
+        """
+        for gap in self.gaps(start, end):
+            if gap.get_width() >= width:
+                return Interval(gap.left, gap.left + width)
+        return None
+
+
+def occupancy_tree(robots):
+    """
+    Returns an IntervalTree of the occupied periods of all the robots in
+    the list `robots`, each with its robot as data
+    """
+    return IntervalTree([(period, robot) for robot in robots
+                         for period in robot.get_occupied_periods()])
+
+
+def free_robots(robots, interval, tree=None):
+    """
+    Returns the list of the robots in `robots` that are not busy at any
+    time of `interval`
+
+    Parameters
+    ----------
+    robots : list of `Robot` references
+    interval : an `Interval`
+    tree : the occupancy_tree of the robots, if already built.
+        Default: None
+    """
+    if tree is None:
+        tree = occupancy_tree(robots)
+    busy = set(id(robot) for _, robot in tree.overlap(interval))
+    return [robot for robot in robots if id(robot) not in busy]
+
+
+if __name__ == "__main__":
+    # Queries agree with brute force over the list of intervals, including
+    # intervals of width 0, for trees built in bulk and by insertion
+    import random
+    rng = random.Random(2024)
+    for trial in range(300):
+        pairs = []
+        for k in range(rng.randint(0, 40)):
+            left = rng.randint(0, 30)
+            pairs.append((Interval(left, left + rng.choice([0, 0, 1, 2, 5, 9])),
+                          k))
+        bulk = IntervalTree(pairs)
+        inserted = IntervalTree()
+        for i, k in pairs:
+            inserted.insert(i, k)
+        assert len(bulk) == len(inserted) == len(pairs)
+        for tree in (bulk, inserted):
+            for t in range(-1, 42):
+                stab = sorted(k for _, k in tree.stab(t))
+                assert stab == sorted(k for i, k in pairs
+                                      if i.left <= t < i.right)
+            for query in range(20):
+                left = rng.randint(-2, 40)
+                other = Interval(left, left + rng.choice([0, 1, 3, 10]))
+                found = sorted(k for _, k in tree.overlap(other))
+                assert found == sorted(k for i, k in pairs
+                                       if i.overlap(other) is not None)
+
+                #gaps: the runs of time steps of the window no interval holds
+                start = other.left
+                end = start + rng.randint(0, 40)
+                busy = set(t for i, _ in pairs for t in range(i.left, i.right))
+                idle = []
+                for t in range(start, end):
+                    if t not in busy:
+                        if idle and idle[-1][1] == t:
+                            idle[-1][1] = t + 1
+                        else:
+                            idle.append([t, t + 1])
+                gaps = tree.gaps(start, end)
+                assert [[g.left, g.right] for g in gaps] == idle
+                width = rng.randint(1, 6)
+                fits = [g for g in idle if g[1] - g[0] >= width]
+                gap = tree.find_gap(width, start, end)
+                if fits:
+                    assert (gap.left, gap.right) == (fits[0][0],
+                                                     fits[0][0] + width)
+                else:
+                    assert gap is None
+    print('IntervalTree queries agree with brute force')
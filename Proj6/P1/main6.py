@@ -8,81 +8,40 @@ Module for Project 6 Robot Task Allocation, with Subclasses of Robot
 
 from robot import Robot, FastRobot, LimbedRobot
 from item import Item
-import numpy as np
-import matplotlib.pyplot as plt
+from spatial_index import RobotGrid, travel_lower_bound
+from scenario import load_scenario, create_objects
+from renderer import animate_fleet
+import heapq
 
 
-def run_robots(data_filename):
+def run_robots(data_filename, video_filename=None):
     """
     Create an allocation of robots to pickup items given a data file in the
-    necessary format.
+    necessary format: a room file, or a binary scenario file (.npz) made by
+    scenario.convert_room.
     :param data_filename:
+    :param video_filename: name of a video file to save the animation to
+        instead of showing it.  Default: None
+    :return: the matplotlib FuncAnimation, which must be kept (e.g., in a
+        variable of the console) for the animation to keep running
     """
-    with open(data_filename, 'r') as fid:
-        # Process the first line of the file
-        line = fid.readline()
-        sim_info = line.strip().split(',')
-        sim_time = int(sim_info[0])
-        horiz_dim = float(sim_info[1])
-        vert_dim = float(sim_info[2])
-        room_size = np.array([horiz_dim, vert_dim])
-
-        # Process the remaining lines of the file
-        robots = []  # list of robots
-        items = []  # list of items
-        for line in fid:
-            # split `line` into a list of strings, with comma as separator
-            tokens = line.strip().split(',')
-
-            if tokens[0][0] == 'I':
-                id_ = int(tokens[1])
-                name = tokens[2].strip()
-                weight = float(tokens[3])
-                arms_required = float(tokens[4])
-                x_loc = int(tokens[5].strip()[1:])
-                y_loc = int(tokens[6].strip()[0:-1])
-                loc = [x_loc, y_loc]
-                duration = int(tokens[7].strip())
-                items.append(Item(id_, name, weight, arms_required,
-                                  duration, loc))
-            elif tokens[0][0] == 'R':
-                id_ = int(tokens[1])
-                max_weight = float(tokens[2])
-                x_loc = int(tokens[3].strip()[1:])
-                y_loc = int(tokens[4].strip()[0:-1])
-                loc = [x_loc, y_loc]
-                robots.append(Robot(id_, max_weight, loc, sim_time))
-            elif tokens[0][0] == 'F':
-                id_ = int(tokens[1])
-                max_weight = float(tokens[2])
-                x_loc = int(tokens[3].strip()[1:])
-                y_loc = int(tokens[4].strip()[0:-1])
-                loc = [x_loc, y_loc]
-                speed_multiplier = float(tokens[5])
-                robots.append(FastRobot(id_, max_weight, loc, sim_time,
-                                        speed_multiplier))
-            elif tokens[0][0] == 'L':
-                id_ = int(tokens[1])
-                max_weight = float(tokens[2])
-                x_loc = int(tokens[3].strip()[1:])
-                y_loc = int(tokens[4].strip()[0:-1])
-                loc = [x_loc, y_loc]
-                slow_multiplier = float(tokens[5])
-                max_payload = int(tokens[6])
-                num_arms = int(tokens[7])
-                robots.append(LimbedRobot(id_, max_weight, loc, sim_time,
-                                         num_arms, slow_multiplier, max_payload))
-
+    scenario = load_scenario(data_filename)
+    sim_time = scenario.sim_time
+    room_size = scenario.room_size
+    robots, items = create_objects(scenario, Robot, Item, FastRobot,
+                                   LimbedRobot)
 
     # Do a task allocation
     #allocated_robots, items_remaining = simple_allocation(robots, items)
-    allocated_robots, items_remaining = create_allocation(robots, items)
+    allocated_robots, items_remaining = create_allocation_indexed(robots, items)
 
     # Animate the simulation
-    animate(robots, items, sim_time, room_size)
+    animation = animate_fleet(robots, items, sim_time, room_size,
+                              video_filename)
 
     # Print descriptive output
     output_results(robots)
+    return animation
 
 
 def simple_allocation(robots, items):
@@ -120,43 +79,6 @@ def simple_allocation(robots, items):
     return allocated_robots, items_remaining
 
 
-def animate(robots, items, sim_time, room_size):
-    """
-    Animate the robots and items in space for `sim_time` timesteps.  At each
-    time step, call the `draw` method for each `Item` and for each `Robot`.
-
-    Assume that the bottom left corner is at (0,0) for room_size
-
-    Parameters
-    ----------
-    robots : list
-        list of `Robot` references
-    items : list
-        list of `Item` references
-    sim_time : int
-        number of timesteps
-    roomsize : list
-        length 2 list that represents the dimensions of the room
-    """
-    plt.close('all')
-    plt.figure()
-    plt.pause(1)
-
-    for t in range(1, sim_time + 1):
-        plt.clf()  # clear figure
-        plt.axis('equal')
-        plt.axis('off')
-        plt.axis([0, room_size[0] + 1, 0, room_size[1] + 1])
-        plt.autoscale(False)
-        plt.title(f"Time = {t}")
-        for item in items:
-            item.draw(t)
-        for robot in robots:
-            _, t_robot = robot.where_am_i()
-            robot.draw(min(t, t_robot - 1))  # So keeps drawing Robot at final location
-        plt.pause(1)
-
-
 def output_results(robots):
     """
     Prints the results of task allocation. Show the stats and tasks for each
@@ -237,8 +159,8 @@ def create_allocation(robots, items):
             #to see which one will result in the smallest value of w1h1+w2h2,
             #which is stored in min_opt_val. before the loop, min_opt_val is set
             #to the w1h1+w2h2 of the first robot in available_robots
-            time_needed=len(available_robots[0].steps_to_arrival(i.loc))-1+i.duration
-            time_so_far = len(available_robots[0].get_locations())
+            time_needed=available_robots[0].travel_time(i.loc)+i.duration
+            time_so_far = available_robots[0].where_am_i()[1]
             time_remaining = available_robots[0].get_total_time() - time_so_far
             time_ratio=time_needed/time_remaining
             min_opt_val=a*time_needed+b*time_ratio
@@ -246,8 +168,8 @@ def create_allocation(robots, items):
                          #corresponding to the current value of min_opt_val
             for j in range(1,len(available_robots)):
                 r=available_robots[j]
-                time_needed=len(r.steps_to_arrival(i.loc))-1+i.duration
-                time_so_far = len(r.get_locations())
+                time_needed=r.travel_time(i.loc)+i.duration
+                time_so_far = r.where_am_i()[1]
                 time_remaining = r.get_total_time() - time_so_far
                 time_ratio=time_needed/time_remaining
                 opt_val=a*time_needed+b*time_ratio
@@ -261,11 +183,114 @@ def create_allocation(robots, items):
             if available_robots[best_index] not in lisR:
                 lisR.append(robots[best_index])
     return lisR, lisI
-        
+
+
+def create_allocation_indexed(robots, items, cell_size=None):
+    """
+    Allocate item pickups to robots with the same objective and the same
+    result as `create_allocation`, but without scoring every robot for
+    every item.
+
+    Parameters
+        ----------
+        robots : list
+            non-empty list of unique `Robot` references
+        items : list
+            non-empty list of unique `Item` references
+        cell_size : float
+            side length of the cells of the `RobotGrid`s of the robots.
+            Default: None, about one robot per cell.
+
+    Algorithm:  The robots are filed by their current location in one
+    `RobotGrid` per speed; robots with no time left are dropped.  For each
+    item, the grids whose robots could carry it are searched together, ring
+    by ring outward from the item, the ring with the smallest lower bound on
+    the travel time first.  A robot is skipped if even the straight line
+    travel time (distance over speed) plus the pickup duration is more than
+    the time it has left, or gives an objective worse than the best so far.
+    The search of a grid stops at the first ring that none of its robots
+    can reach in the time they have left, or whose lower bound on the
+    objective is worse than the best so far.  Ties go to the robot that
+    comes first in `robots`, as in `create_allocation`.  After a pick, the
+    robot is filed again at its new location.
+
+    Returns
+    -------
+    lisR : list
+        list of the `Robot`s that picked up `Item`s
+    lisI : list
+        list of remaining `Item`s that didn't get picked up
+    """
+    a = 0.8  # weight for the time_needed objective
+    b = 0.2  # weight for the time_ratio objective
+    #one grid per speed, so that slow robots are not searched as far as
+    #the fastest robot could come from
+    by_speed = {}
+    for k in range(len(robots)):
+        by_speed.setdefault(robots[k].get_speed(), []).append(k)
+    grids = [RobotGrid(robots, cell_size, ks) for ks in by_speed.values()]
+    grid_of = {k: g for g in grids for k in g.robot_indices()}
+    lisR = []
+    in_lisR = set()
+    lisI = []
+    for i in items:
+        best_val = None
+        best_index = None
+        #rings of all the grids, nearest (in time) first
+        searches = []
+        for g in range(len(grids)):
+            if not i.valid_pickup(grids[g].max_payload, grids[g].max_arms):
+                continue  # no robot of this grid can pick the item up
+            rings = grids[g].rings(i.loc)
+            ring = next(rings, None)
+            if ring is not None:
+                searches.append((grids[g].ring_lower_bound(ring[0]), g, ring,
+                                 rings, grids[g].max_time_left()))
+        heapq.heapify(searches)
+        while searches:
+            lower, g, (k, indices), rings, max_time_left = \
+                heapq.heappop(searches)
+            #no robot in this ring or farther has the time, or does better
+            lower += i.duration
+            if lower > max_time_left:
+                continue
+            if (best_val is not None
+                    and a*lower + b*(lower/max_time_left) > best_val):
+                continue
+            ring = next(rings, None)
+            if ring is not None:
+                heapq.heappush(searches, (grids[g].ring_lower_bound(ring[0]),
+                                          g, ring, rings, max_time_left))
+            for j in indices:
+                r = robots[j]
+                time_remaining = r.get_total_time() - r.where_am_i()[1]
+                lower = travel_lower_bound(r, i.loc) + i.duration
+                if time_remaining <= 0 or lower > time_remaining:
+                    continue
+                if (best_val is not None
+                        and a*lower + b*(lower/time_remaining) > best_val):
+                    continue
+                if not r.pick(i, False):
+                    continue
+                time_needed = r.travel_time(i.loc) + i.duration
+                opt_val = a*time_needed + b*(time_needed/time_remaining)
+                if (best_val is None
+                        or (opt_val, j) < (best_val, best_index)):
+                    best_val = opt_val
+                    best_index = j
+        if best_index is None:
+            lisI.append(i)
+        else:
+            robots[best_index].pick(i)
+            grid_of[best_index].move(best_index)
+            if best_index not in in_lisR:
+                in_lisR.add(best_index)
+                lisR.append(robots[best_index])
+    return lisR, lisI
             
 
 
 if __name__ == '__main__':
     #run_robots("room2.txt")
-    run_robots("room3.txt")
+    animation = run_robots("room3.txt")
 
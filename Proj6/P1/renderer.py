@@ -0,0 +1,114 @@
+# renderer.py
+"""
+Batched animation of the robots and items of Project 6
+
+Clearing the figure at every time step and drawing each item and robot
+again with its `draw` method (a filled polygon and a text label per object)
+makes a frame cost more and more artists as the fleet grows.  animate_fleet
+draws all the robots as one collection of disks and all the items as one
+collection of squares, once, with the batch functions of shapes.py, and
+each frame only moves the disks (`set_offsets`) and hides the items that
+are picked up (their face colors), with the locations and pickup status of
+a `Trajectories` store.  The frames can be shown on screen or saved straight
+to a video file.
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.animation import FuncAnimation
+from matplotlib.colors import to_rgba
+from shapes import draw_disks, draw_rects
+from trajectory import Trajectories, PICKED
+
+
+def animate_fleet(robots, items, sim_time, room_size, filename=None, fps=1,
+                  labels=None):
+    """
+    Animate the robots and items in space for `sim_time` timesteps, with
+    one artist for all the robots and one for all the items.  Returns the
+    matplotlib FuncAnimation, which the caller must keep a reference to for
+    the animation to keep running.
+
+    Assume that the bottom left corner is at (0,0) for room_size
+
+    Parameters
+    ----------
+    robots : list
+        list of `Robot` references
+    items : list
+        list of `Item` references
+    sim_time : int
+        number of timesteps
+    room_size : list
+        length 2 list that represents the dimensions of the room
+    filename : str
+        name of a video file (e.g. 'run.mp4', or 'run.gif' without ffmpeg)
+        to save the frames to instead of showing them.  Default: None, show
+        them on screen
+    fps : number
+        frames (time steps) per second.  Default: 1
+    labels : bool
+        label the robots and items with their ids (one text per object, so
+        slower).  Default: None, label them if there are at most 100 objects
+    """
+    if labels is None:
+        labels = len(robots) + len(items) <= 100
+    trajectories = Trajectories(robots, items, sim_time)
+
+    plt.close('all')
+    fig = plt.figure()
+    ax = fig.add_subplot()
+    ax.set_aspect('equal')
+    ax.axis('off')
+    ax.axis([0, room_size[0] + 1, 0, room_size[1] + 1])
+    ax.set_autoscale_on(False)
+    title = ax.set_title('Time = 1')
+
+    #items: red squares of side 1, hidden once picked up
+    locs = np.array([i.loc for i in items], dtype=float).reshape(-1, 2)
+    item_colors = np.tile(to_rgba('r'), (len(items), 1))
+    item_artist = draw_rects(locs[:, 0] - 0.5, locs[:, 1] - 0.5, 1, 1,
+                             item_colors)
+    item_artist.set_edgecolor('none')
+
+    #robots: disks of diameter 1, in the color of their class, drawn at the
+    #origin and moved to the robots' locations by their offsets
+    start = trajectories.positions_at(1)
+    robot_artist = draw_disks(np.zeros(len(robots)), np.zeros(len(robots)),
+                              0.5, [r.color for r in robots])
+    robot_artist.set_edgecolor('none')
+    robot_artist.set_offset_transform(ax.transData)
+    robot_artist.set_offsets(start)
+
+    item_text = []
+    robot_text = []
+    if labels:
+        item_text = [ax.text(i.loc[0], i.loc[1], str(i.id_),
+                             horizontalalignment='center') for i in items]
+        robot_text = [ax.text(start[k, 0], start[k, 1],
+                              str(robots[k].get_id()),
+                              horizontalalignment='center')
+                      for k in range(len(robots))]
+
+    def update(frame):
+        t = frame + 1
+        title.set_text(f'Time = {t}')
+        visible = trajectories.item_status(t) != PICKED
+        item_colors[:, 3] = visible
+        item_artist.set_facecolor(item_colors)
+        positions = trajectories.positions_at(t)
+        robot_artist.set_offsets(positions)
+        for k in range(len(item_text)):
+            item_text[k].set_visible(visible[k])
+        for k in range(len(robot_text)):
+            robot_text[k].set_position(positions[k])
+        return [title, item_artist, robot_artist] + item_text + robot_text
+
+    update(0)
+    animation = FuncAnimation(fig, update, frames=sim_time,
+                              interval=1000/fps, repeat=False)
+    if filename is None:
+        plt.show()
+    else:
+        animation.save(filename, fps=fps)
+    return animation
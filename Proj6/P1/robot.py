@@ -1,12 +1,35 @@
 # robot.py
 import math
 from interval import Interval
+from timeline import Timeline
 from shapes import draw_disk
 import matplotlib.pyplot as plt
 import copy
 import numpy as np
 
 
+def _num_steps(dist, speed):
+    """
+    Returns the number of time steps needed to cover the distance `dist`
+    moving at most `speed` in each time step, i.e., ceil(dist/speed).  A
+    distance within rounding error of a whole number of steps takes that
+    number of steps.  Returns an int if `dist` and `speed` are numbers, an
+    int array if either is an array.
+    """
+    if not isinstance(dist, np.ndarray) and not isinstance(speed, np.ndarray):
+        n = math.floor(dist/speed)
+        if not math.isclose(n*speed, dist, rel_tol=1e-9, abs_tol=1e-9):
+            n += 1
+        return n
+    dist = np.asarray(dist, dtype=float)
+    n = np.floor(dist/speed)
+    # same test as math.isclose(n*speed, dist, rel_tol=1e-9, abs_tol=1e-9)
+    covered = n*speed
+    close = (np.abs(covered - dist)
+             <= np.maximum(1e-9*np.maximum(np.abs(covered), dist), 1e-9))
+    return (n + ~close).astype(int)
+
+
 class Robot:
     """
     A robot has an id_, a maximum weight it can pick up, a list of periods
@@ -15,10 +38,13 @@ class Robot:
     cardinal directions only--north, east, south, west (NESW)--and moves
     one unit distance in each time step.
     
-    Class attribute
-    ---------------
+    Class attributes
+    ----------------
     color : str
         Robot's color. A regular `Robot` is blue
+    straight_line : bool
+        False: a `Robot` goes to a location by moving all of x first and then
+        all of y
 
     Attributes
     ----------
@@ -34,23 +60,35 @@ class Robot:
         Example: if the robot is assigned a task from time 1 to time 3 and
         another task from time 4 to time 5, then the list should be
             [Interval(1,3), Interval(4,5)]
-    _locations : list
-        Each element of the list is the location of the robot at a time step.
-        Initially the list has just the starting location of the robot,
-        corresponding to time 1. The maximum eventual length of the list
-        is `_total_time`.  Each location is itself a list of two numbers: the
-        x-coordinate followed by the y-coordinate.
+    _timeline : Timeline
+        The robot's run as a `Timeline` of travel and pick `Segment`s,
+        starting at the starting location of the robot at time 1.  The
+        location of the robot at each time step is computed from it on
+        demand, so memory grows with the number of tasks, not with the number
+        of time steps.  The time of the most recent location is
+        `_timeline.end_time`, at most `_total_time`.
         Example: if `Robot` at position (4,5) is allocated a task that
-        requires it to move east 2 units of distance, then three consecutive
-        rows of `_locations` would be
+        requires it to move east 2 units of distance, then the locations at
+        three consecutive time steps would be
             [[4,5], [5,5], [6,5]]
         indicating that `Robot` moves two units east over two time steps.
     _items_picked : list
         Each element of the list is an item that the robot has picked up.  The
         list is initially empty.
+    _fleet : Fleet or None
+        The `Fleet` the robot is attached to, or None.  Once attached, the
+        attributes named in the class attribute `_fleet_fields` are not
+        kept by the robot but in the fleet's arrays (see `attach`).
+    _slot : int or None
+        The index of the robot in the arrays of `_fleet`
     """
 
     color= 'b'  # Class attribute
+    straight_line = False  # moves all of x, then all of y
+    #instance attributes kept in the arrays of a `Fleet` once attached to
+    #one, and the names of these arrays
+    _fleet_fields = {'_id_': 'ids', '_max_weight': 'max_weight',
+                     '_total_time': 'total_time'}
 
 
     def __init__(self, id_, max_weight, starting_location, total_time):
@@ -71,27 +109,126 @@ class Robot:
 
         self._id_ = id_
         self._max_weight = max_weight
-        self._locations = [starting_location]
+        self._timeline = Timeline(starting_location, 1)
+        self._fleet = None
+        self._slot = None
         self._items_picked = []
         self._occupied_periods = []
         self._total_time = total_time
         
 
+    def _get(self, attribute):
+        """
+        Returns the value of the instance attribute `attribute` (a key of
+        `_fleet_fields`): the attribute itself, or the robot's element of
+        the fleet array that holds it once the robot is attached to a fleet
+        """
+        if self._fleet is None:
+            return getattr(self, attribute)
+        column = getattr(self._fleet, self._fleet_fields[attribute])
+        return column[self._slot].item()
+
+
     def get_id(self):
         """
         Returns (int) the `_id_` of the robot
         """
 
-        return self._id_
+        return self._get('_id_')
     
 
     def get_total_time(self):
         """
         Returns (int) the `_total_time` of the robot
         """
-        return self._total_time
+        return self._get('_total_time')
     
 
+    def get_speed(self):
+        """
+        Returns (number) the largest distance the robot can move in one time
+        step.  A `Robot` moves one unit distance in each time step.
+        """
+        return 1
+    
+
+    def get_max_weight(self):
+        """
+        Returns (number) the `_max_weight` of the robot
+        """
+        return self._get('_max_weight')
+
+
+    def get_payload_factor(self):
+        """
+        Returns (number) the factor of `_max_weight` that the robot can pick
+        up.  A `Robot` can pick up its `_max_weight`.
+        """
+        return 1
+
+
+    def get_payload(self):
+        """
+        Returns (number) the maximum weight the robot can pick up, as checked
+        by `pick`: get_payload_factor() times `_max_weight`
+        """
+        return self.get_payload_factor()*self.get_max_weight()
+
+
+    def attach(self, fleet, slot):
+        """
+        Attaches the robot to `fleet`, as robot number `slot` of its arrays,
+        which must already hold the robot's values.  The attributes in
+        `_fleet_fields` are then read from the fleet's arrays instead of
+        being kept by the robot, and the robot writes its new location and
+        time to the fleet each time it picks an item.
+        Raises a ValueError if the robot is already attached to a fleet.
+        """
+        if self._fleet is not None:
+            raise ValueError(f'Robot {self.get_id()} is already in a fleet')
+        self._fleet = fleet
+        self._slot = slot
+        for attribute in self._fleet_fields:
+            delattr(self, attribute)
+
+
+    def detach(self):
+        """
+        Detaches the robot from its fleet, if any: the robot keeps its own
+        attributes again, with the values in the fleet's arrays
+        """
+        if self._fleet is None:
+            return
+        values = {a: self._get(a) for a in self._fleet_fields}
+        self._fleet = None
+        self._slot = None
+        for attribute, value in values.items():
+            setattr(self, attribute, value)
+
+
+    def get_num_arms(self):
+        """
+        Returns (int) the number of arms the robot has, as checked by `pick`.
+        A `Robot` has no arms.
+        """
+        return 0
+
+
+    def get_occupied_periods(self):
+        """
+        Returns a copy of the `_occupied_periods`.
+        """
+
+        return copy.deepcopy(self._occupied_periods)
+
+
+    def get_timeline(self):
+        """
+        Returns the `_timeline` of the robot (not a copy: do not modify it)
+        """
+        return self._timeline
+
+
     def get_items_picked(self):
         """
         Returns a copy of the `_items_picked`.
@@ -103,18 +240,22 @@ class Robot:
 
     def get_locations(self):
         """
-        Return a copy of the `_locations`
+        Return a read-only n-by-2 array of the locations of the robot at time
+        steps 1 to n, n the time of the most recent location.  The array is
+        computed from `_timeline`.
         """
 
-        # return self._locations.copy()
-        return copy.deepcopy(self._locations)
+        locations = self._timeline.positions(
+            np.arange(1, self._timeline.end_time + 1))
+        locations.flags.writeable = False
+        return locations
     
 
     def where_am_i(self):
         """
         Determine the most recent location of the `Robot` along with the time
-        it corresponded to.  The most recent location is the last location in
-        `_locations`.
+        it corresponded to: the end of the robot's run, `_timeline.end_loc`
+        at time `_timeline.end_time`.
 
         Returns a tuple (lis, time) where
         -------
@@ -125,15 +266,46 @@ class Robot:
             time of most the recent location
         """
 
-        return self._locations[-1].copy(), len(self._locations)
+        return self._timeline.end_loc.tolist(), self._timeline.end_time
     
 
+    def travel_time(self, loc):
+        """
+        Returns (int) the number of time steps the robot needs to travel from
+        its current location to `loc`, i.e., len(self.steps_to_arrival(loc))-1,
+        without building the path.  The robot moves all of x first and then
+        all of y, `get_speed()` distance in each time step, so this is the sum
+        of the ceilings of the distance along each axis over the speed: the
+        Manhattan distance for a `Robot`.
+
+        Parameter loc: (list) a length 2 list storing the destination x-y
+            coordinate
+        """
+        here = self._timeline.end_loc
+        speed = self.get_speed()
+        return (_num_steps(abs(loc[0] - here[0]), speed)
+                + _num_steps(abs(loc[1] - here[1]), speed))
+
+
+    def _corner(self, loc):
+        """
+        Returns (list) the location where the path to `loc` turns: the
+        robot's current location if `straight_line` is True, otherwise the
+        location with the x of `loc` and the current y
+        """
+        here = self._timeline.end_loc
+        if self.straight_line:
+            return [here[0], here[1]]
+        return [loc[0], here[1]]
+
+
     def steps_to_arrival(self, loc):
         """
-        Returns a valid list of locations for each time step of a path that the
-        robot can take from its current location to reach the location `loc`.
-        The path needs not be optimal.  The first location of the list is the
-        robot's current location; the last location of the list is `loc`.
+        Returns a valid path of locations for each time step that the robot
+        can take from its current location to reach the location `loc`, as a
+        (travel_time(loc)+1)-by-2 array.  The path needs not be optimal.  The
+        first row is the robot's current location; the last row is `loc`.
+        See `paths_to_arrival` for the path each kind of robot takes.
 
         This method considers the path only and does not consider whether
         there is enough time to reach `loc`.
@@ -144,34 +316,8 @@ class Robot:
             a length 2 list storing the destination x-y coordinate
         """
 
-        # Current location
-        initial_pos, _ = self.where_am_i()
-
-        # Not required: same locations case
-        if np.allclose(initial_pos, loc):
-            return [initial_pos]
-
-        init_x = initial_pos[0]
-        init_y = initial_pos[1]
-
-        # Change all of x, then change all of y
-        steps = []
-        delta_x = loc[0] - init_x
-        if not np.allclose(delta_x, 0):
-            sign = int(delta_x / abs(delta_x))
-            for x in range(init_x, loc[0] + sign, sign):
-                steps.append([x, init_y])
-        else:
-            x = init_x
-            steps.append(initial_pos)
-
-        delta_y = loc[1] - init_y
-        if not np.allclose(delta_y, 0):
-            sign = int(delta_y / abs(delta_y))
-            # Have to offset initial y to prevent repeat
-            for y in range(init_y + sign, loc[1] + sign, sign):
-                steps.append([x, y])
-        return steps
+        paths, _ = paths_to_arrival([self], loc)
+        return paths[0]
 
 
     def pick(self, item, do_pick=True, max_payload=None, num_arms=0):
@@ -188,7 +334,7 @@ class Robot:
 
         If the pickup does occur,
           1. Update `item`'s picked_window
-          2. Update `Robot`'s `_locations`, `_occupied_periods`, and
+          2. Update `Robot`'s `_timeline`, `_occupied_periods`, and
                `_items_picked`. The `Interval` appended to `_occupied_periods`
                should include both the travel time and pickup duration.
         No attributes should be updated if the pickup does not occur.
@@ -215,19 +361,18 @@ class Robot:
         """
 
         if max_payload is None:
-            max_payload = self._max_weight
+            max_payload = self.get_max_weight()
 
         success = False
 
         # Time needed to travel and pick up.
         # Arrive at item, then spend item.duration time there to pick up
-        steps = self.steps_to_arrival(item.loc)
-        travel_time = len(steps) - 1  # steps includes starting position
+        travel_time = self.travel_time(item.loc)
         time_needed = travel_time + item.duration
 
         # Time remaining
-        time_so_far = len(self._locations)
-        time_remaining = self._total_time - time_so_far
+        time_so_far = self._timeline.end_time
+        time_remaining = self.get_total_time() - time_so_far
 
         if (time_needed <= time_remaining and item.picked_window is None
                 and item.valid_pickup(max_payload, num_arms)):
@@ -239,11 +384,18 @@ class Robot:
             item.update_pickup_status(pick_start + travel_time)
             self._items_picked.append(item)
 
-            # Update locations
-            location_picking = [item.loc for _ in range(item.duration)]
-
-            # Don't use steps[0] since that repeats the starting location
-            self._locations = self._locations + steps[1:] + location_picking
+            # Update the timeline: travel to the corner of the path and on
+            # to the item, then stay there to pick it up
+            here = self._timeline.end_loc
+            corner = self._corner(item.loc)
+            speed = self.get_speed()
+            to_corner = _num_steps(math.hypot(corner[0] - here[0],
+                                              corner[1] - here[1]), speed)
+            self._timeline.add_travel(to_corner, corner, speed)
+            self._timeline.add_travel(travel_time - to_corner, item.loc, speed)
+            self._timeline.add_pick(item.duration, item)
+            if self._fleet is not None:
+                self._fleet.update(self._slot)
 
         return success
     
@@ -255,13 +407,13 @@ class Robot:
 
         Assumes figure window is already open.
 
-        Parameter t: (int) the time. len(self._locations)>=t>=1
+        Parameter t: (int) the time. self._timeline.end_time>=t>=1
         """
 
         r = 0.5
-        center = self._locations[t - 1]
+        center = self._timeline.position_at(t)
         draw_disk(center[0], center[1], r, self.color)
-        plt.text(center[0], center[1], str(self._id_),
+        plt.text(center[0], center[1], str(self.get_id()),
                  horizontalalignment='center')
 
 
@@ -270,10 +422,20 @@ class FastRobot(Robot):
     A `FastRobot` is a `Robot`. A `FastRobot` can move at most `_speed_multiplier`
     distance in one timestep. A `FastRobot` is green ('g')
     
-    Class attribute
-    ---------------
+    Class attributes
+    ----------------
     color : str
         FastRobot's color. A `FastRobot` is green
+    straight_line : bool
+        True: a `FastRobot` goes to a location along the straight line from
+        its current location, `_speed_multiplier` distance in each time step
+        with a shorter last step if needed.
+        Example 1: with speed multiplier 3, from [0,0] to [4,0], the path is
+          [[0,0], [3,0], [4,0]]
+        Example 2: with speed multiplier sqrt(2), from [0,0] to [2,2], the
+          path is [[0,0], [1.0,1.0], [2,2]]
+        Example 3: with speed multiplier 6, from [0,0] to [3,4], the path is
+          [[0,0], [3,4]]
         
     Instance attributes
     -------------------
@@ -282,64 +444,46 @@ class FastRobot(Robot):
     """
     
     color= 'g'  # Class attribute
+    straight_line = True
+    _fleet_fields = dict(Robot._fleet_fields, _speed_multiplier='speed')
     
 
     def __init__(self, id_, max_weight, starting_loc, total_time,
-                 speed_multiplier=np.random.randint(1, 7)):
+                 speed_multiplier=None):
         """
-        Construct a `FastRobot` with a speed multiplier.
+        Construct a `FastRobot` with a speed multiplier.  If
+        `speed_multiplier` is None, it is a random integer from 1 to 6 drawn
+        from np.random now, so that np.random.seed makes runs reproducible.
         """
         super().__init__(id_, max_weight, starting_loc, total_time) #call
                                                                     #parent
                                                                     #initializer
+        if speed_multiplier is None:
+            speed_multiplier=np.random.randint(1, 7)
         self._speed_multiplier=speed_multiplier #initializes instance attribute
                                                 #_speed_multiplier
 
+
+    def get_speed(self):
+        """
+        Returns (number) the `_speed_multiplier` of the robot
+        """
+        return self._get('_speed_multiplier')
+
         
-    def steps_to_arrival(self, loc):
+    def travel_time(self, loc):
         """
-        Returns the list of locations for each time step of a path that the 
-          robot takes from its current location to reach the location `loc`. 
-          This robot can move `_speed_multiplier` distance in one timestep.
-          This robot can only move in one direction once it starts moving,
-          meaning it can only move in the straight line path from its starting 
-          location to `loc`.  The first location of the list is the robot's 
-          current location; the last location of the list is `loc`.
+        Returns (int) the number of time steps the robot needs to travel from
+          its current location to `loc` along the straight line, i.e.,
+          ceil(distance/_speed_multiplier), without building the path.
 
         Parameter `loc`:
             (list) a length 2 list storing the destination x-y coordinate
+        """
+        here=self._timeline.end_loc
+        return _num_steps(math.hypot(loc[0]-here[0],loc[1]-here[1]),
+                          self.get_speed())
 
-        Example 1: If a `FastRobot` with speed multiplier of 3 is to go from
-          [0,0] to [4,0], then the list of locations is [[0,0], [3,0], [4,0]]
-        Example 2: If a 'FastRobot' with speed multiplier of sqrt(2) is to go from
-          [0,0] to [2,2], then the list of locations is [[0,0], [1.0,1.0], [2,2]]
-        Example 3: If a 'FastRobot' with speed multiplier of 6 is to go from
-          [0,0] to [3,4], then the list of locations is [[0,0], [3,4]]
-        """
-        current_location,_=self.where_am_i()
-        dx=loc[0]-current_location[0]
-        dy=loc[1]-current_location[1]
-        theta=np.arctan2(dy,dx)
-        steps=[current_location]#initializes steps (list to be returned) with
-                                #its first value, the robot's current location
-        total_dis=math.sqrt(dx**2+dy**2) #total distance robot will need to travel
-        intermediate_steps=int(total_dis//self._speed_multiplier)+1 #number of steps
-                                                           #that would allow
-                                                           #robot to reach
-                                                           #loc (if total_dis is
-                                                           #divisible by _speed_multiplier)
-                                                           #or just before loc
-                                                           #(if not divisible)
-        #adds the robot's location at each timestamp until it reaches loc or the
-        #step right before loc to steps
-        for i in range (1,intermediate_steps+1):
-            steps.append([steps[i-1][0]+self._speed_multiplier*math.cos(theta),\
-            steps[i-1][1]+self._speed_multiplier*math.sin(theta)])
-        #if (total_dis not divisible by _speed_multiplier), robot needs to take one
-        #more step to get to loc
-        if not np.allclose(steps[-1],loc):
-            steps.append(loc)
-        return steps
 
 class LimbedRobot(Robot):
     """
@@ -351,7 +495,9 @@ class LimbedRobot(Robot):
     Class attribute
     ---------------
     color : str
-        LimbedRobot's color.  A `LimbedRobot` is magenta
+        LimbedRobot's color.  A `LimbedRobot` is magenta.  Like a `Robot`,
+        a `LimbedRobot` goes to a location by moving all of x first and then
+        all of y, `_slowdown_multiplier` distance in each time step
         
     Instance attributes
     -------------------
@@ -360,21 +506,29 @@ class LimbedRobot(Robot):
         Assume this is in the range (0, 1)
     _max_payload_factor : int
         A `LimbedRobot` can pick up `_max_payload_factor` times
-        its `_max_weight`.  Default to a random integer between 2 and 7.
+        its `_max_weight`.  Default to a random integer from 2 to 6, drawn
+        when the robot is constructed.
     _num_arms : int
         Number of arms the `LimbedRobot` has
     """
     
     color= 'm'  # Class attribute
+    _fleet_fields = dict(Robot._fleet_fields, _slowdown_multiplier='speed',
+                         _max_payload_factor='payload_factor',
+                         _num_arms='num_arms')
 
 
     def __init__(self, id_, max_weight, starting_loc, total_time, num_arms,
                  slowdown_multiplier,
-                 max_payload_factor=np.random.randint(2, 7)):
+                 max_payload_factor=None):
         """
         Construct a `LimbedRobot` with a `_slowdown_multiplier` and a 
-          `_max_payload_factor`
+          `_max_payload_factor`.  If `max_payload_factor` is None, it is a
+          random integer from 2 to 6 drawn from np.random now, so that
+          np.random.seed makes runs reproducible.
         """
+        if max_payload_factor is None:
+            max_payload_factor=np.random.randint(2, 7)
         #intializes instance attributes
         self._slowdown_multiplier=slowdown_multiplier
         self._max_payload_factor=max_payload_factor
@@ -382,60 +536,28 @@ class LimbedRobot(Robot):
         #call parent initializer
         super().__init__(id_, max_payload_factor*max_weight, starting_loc,\
         total_time)
-        
 
-    def steps_to_arrival(self, loc):
+
+    def get_speed(self):
         """
-        Returns the list of locations for each time step of a path that the 
-          robot takes from its current location to reach the location `loc`. 
-          This robot can only move `_slowdown_multiplier` distance in one
-          timestep and can only move in either the x or the y direction in one
-          step.  The first location of the list is the robot's current 
-          location; the last location of the list is `loc`.
- 
-        Parameter `loc`:
-            (list) a length 2 list storing the destination x-y coordinate
-       """
-        # Current location
-        initial_pos, _ = self.where_am_i()
-
-        # Not required: same locations case
-        if np.allclose(initial_pos, loc):
-            return [initial_pos]
-
-        init_x = initial_pos[0]
-        init_y = initial_pos[1]
-        steps = [initial_pos] #initializes steps (list to be returned) with
-                              #its first value, the robot's initial position
-                              
-                              
-        # Change all of x, then change all of y
-        delta_x = loc[0] - init_x
-        #number of steps that would allow robot to reach x val of loc (if
-        #delta_x is divisible by _slowdown_multiplier) or just before x val of loc
-        #(if not divisible)
-        intermediate_steps=int(abs(delta_x)//self._slowdown_multiplier)+1
-        #adds the robot's location at each timestamp until it reaches x val of
-        #loc or the step right before it reaches that x val to steps
-        for i in range (1,intermediate_steps):
-            sign = int(delta_x / abs(delta_x))
-            steps.append([steps[-1][0]+self._slowdown_multiplier*sign,init_y])
-        #if (delta_xnot divisible by _slowdown_multiplier), robot needs to take one
-        #more step to get to x val of loc
-        if not np.isclose(steps[-1][0],loc[0]):
-            steps.append([loc[0],init_y])
-        
-        #same as above, but with y vals
-        delta_y = loc[1] - init_y
-        intermediate_steps=int(abs(delta_y)//self._slowdown_multiplier)+1
-        for i in range (1,intermediate_steps):
-            sign = int(delta_y / abs(delta_y))
-            steps.append([loc[0],steps[-1][1]+self._slowdown_multiplier*sign])
-        if not np.isclose(steps[-1][1],loc[1]):
-            steps.append(loc)
-        
+        Returns (number) the `_slowdown_multiplier` of the robot
+        """
+        return self._get('_slowdown_multiplier')
+
+
+    def get_payload_factor(self):
+        """
+        Returns (int) the `_max_payload_factor` of the robot
+        """
+        return int(self._get('_max_payload_factor'))
+
+
+    def get_num_arms(self):
+        """
+        Returns (int) the `_num_arms` of the robot
+        """
+        return int(self._get('_num_arms'))
         
-        return steps
 
     def pick(self, item, do_pick=True):
         """
@@ -443,8 +565,103 @@ class LimbedRobot(Robot):
         The only difference is that a `LimbedRobot` has a different payload
           and a number of arms.
         """
-        success=super().pick(item,do_pick,self._max_payload_factor*self._max_weight,\
-                self._num_arms) #calls parent function pick with max_payload
-                                #parameter as the value of
-                                #_max_payload_factor*_max_weight
+        success=super().pick(item,do_pick,self.get_payload(),\
+                self.get_num_arms()) #calls parent function pick with max_payload
+                                     #parameter as the value of
+                                     #_max_payload_factor*_max_weight
         return success
+
+
+def paths_to_arrival(robots, loc):
+    """
+    Computes at once the paths of all the robots in `robots` from their
+    current locations to the location `loc`, and returns (paths, lengths):
+
+    paths : a len(robots)-by-m-by-2 array, m the length of the longest path.
+        paths[k, :lengths[k]] is the path of robots[k], the same as
+        robots[k].steps_to_arrival(loc); the rows after it are all `loc`.
+    lengths : an int array, lengths[k] is robots[k].travel_time(loc)+1
+
+    A path has two legs: from the current location to a corner, then from
+    the corner to `loc`.  The corner is [loc[0], y of the current location]
+    if the robot's `straight_line` is False (all of x, then all of y), and
+    the current location if it is True.  Along each leg the robot moves
+    `get_speed()` distance in each time step, with a shorter last step if
+    needed.  Each location is computed from the start of its leg, so
+    rounding errors do not add up, and the corner and `loc` are exact.
+
+    Parameters
+    ----------
+    robots : list
+        list of `Robot` references
+    loc : list
+        a length 2 list storing the destination x-y coordinate
+    """
+    loc = np.asarray(loc, dtype=float)
+    starts = np.array([r.where_am_i()[0] for r in robots],
+                      dtype=float).reshape(-1, 2)
+    speeds = np.array([r.get_speed() for r in robots], dtype=float)
+    straight = np.array([r.straight_line for r in robots], dtype=bool)
+
+    corners = starts.copy()
+    corners[~straight, 0] = loc[0]
+    delta1 = corners - starts
+    delta2 = loc - corners
+    len1 = np.hypot(delta1[:, 0], delta1[:, 1])
+    len2 = np.hypot(delta2[:, 0], delta2[:, 1])
+    n1 = _num_steps(len1, speeds)  # number of steps of each leg
+    n2 = _num_steps(len2, speeds)
+    lengths = n1 + n2 + 1
+    unit1 = delta1/np.where(len1 > 0, len1, 1)[:, None]
+    unit2 = delta2/np.where(len2 > 0, len2, 1)[:, None]
+
+    # distance along each leg at each time step, then the locations
+    t = np.arange(lengths.max() if len(robots) > 0 else 0)
+    along1 = np.minimum(np.outer(speeds, t), len1[:, None])
+    along2 = np.clip((t - n1[:, None])*speeds[:, None], 0, len2[:, None])
+    paths = np.where((t < n1[:, None])[:, :, None],
+                     starts[:, None] + along1[:, :, None]*unit1[:, None],
+                     corners[:, None] + along2[:, :, None]*unit2[:, None])
+    paths[t >= (lengths - 1)[:, None]] = loc
+    return paths, lengths
+
+
+def travel_time_matrix(starts, speeds, straight, locs):
+    """
+    Returns an n-by-m int array whose element [k, j] is the number of time
+    steps robot k needs to travel to locs[j], as given by travel_time
+
+    Parameters
+    ----------
+    starts : n-by-2 array of the current locations of the robots
+    speeds : length n array of the robots' `get_speed()`
+    straight : length n bool array of the robots' `straight_line`
+    locs : list of m length 2 lists (or an m-by-2 array) of x-y coordinates
+    """
+    speeds = np.asarray(speeds, dtype=float)[:, None]
+    delta = np.abs(np.asarray(locs, dtype=float).reshape(-1, 2)[None]
+                   - np.asarray(starts, dtype=float).reshape(-1, 2)[:, None])
+    along_line = _num_steps(np.hypot(delta[:, :, 0], delta[:, :, 1]), speeds)
+    along_axes = (_num_steps(delta[:, :, 0], speeds)
+                  + _num_steps(delta[:, :, 1], speeds))
+    return np.where(np.asarray(straight, dtype=bool)[:, None], along_line,
+                    along_axes)
+
+
+def travel_times(robots, locs):
+    """
+    Returns a len(robots)-by-len(locs) int array whose element [k, j] is
+    robots[k].travel_time(locs[j]), computed for all pairs at once
+
+    Parameters
+    ----------
+    robots : list
+        list of `Robot` references
+    locs : list or array
+        list of length 2 lists (or an n-by-2 array) of x-y coordinates
+    """
+    starts = np.array([r.where_am_i()[0] for r in robots],
+                      dtype=float).reshape(-1, 2)
+    speeds = np.array([r.get_speed() for r in robots], dtype=float)
+    straight = np.array([r.straight_line for r in robots], dtype=bool)
+    return travel_time_matrix(starts, speeds, straight, locs)
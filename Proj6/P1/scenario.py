@@ -0,0 +1,29 @@
+# scenario.py
+"""
+Loading of robot task allocation scenarios (room files) for Project 6
+
+The loader is shared with Project 5.  Each project directory imports its
+modules by name, with no package to share them through, so this module
+loads Proj5/scenario.py by its path and exports its names; see that file
+for the room file and .npz formats.
+"""
+
+import importlib.util
+import os
+import sys
+
+_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                     os.pardir, 'Proj5', 'scenario.py')
+_spec = importlib.util.spec_from_file_location('proj5_scenario', _path)
+_shared = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = _shared  # so that Scenarios can be pickled
+_spec.loader.exec_module(_shared)
+
+ROBOT_KINDS = _shared.ROBOT_KINDS
+DEFAULT_PAYLOAD = _shared.DEFAULT_PAYLOAD
+Scenario = _shared.Scenario
+read_room = _shared.read_room
+save_scenario = _shared.save_scenario
+load_scenario = _shared.load_scenario
+convert_room = _shared.convert_room
+create_objects = _shared.create_objects
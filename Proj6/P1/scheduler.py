@@ -0,0 +1,145 @@
+# scheduler.py
+"""
+Discrete-event core of the Project 6 robot simulation
+
+Instead of stepping through every time step, the simulation jumps from one
+event to the next: events are kept in a priority queue (heapq) ordered by
+time, and only the times at which something happens (a robot sets off,
+arrives, starts or ends a pickup, becomes free) are visited.  The work done
+grows with the number of tasks, not with the length of the simulation.
+"""
+
+import heapq
+from assignment import item_columns
+from fleet import Fleet
+
+
+class EventQueue:
+    """
+    An EventQueue is a priority queue of events (time, kind, data).  Events
+    come out in time order; events at the same time come out in the order
+    they were pushed.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty EventQueue
+        """
+        self._heap = []
+        self._count = 0  # number of events pushed, breaks ties in time
+
+
+    def push(self, time, kind, data=None):
+        """
+        Adds the event (time, kind, data)
+
+        Parameters
+        ----------
+        time : (number) the time of the event
+        kind : (str) what happens, e.g., 'arrive'
+        data : anything the event is about, e.g., a robot.  Default: None
+        """
+        heapq.heappush(self._heap, (time, self._count, kind, data))
+        self._count += 1
+
+
+    def pop(self):
+        """
+        Removes and returns the earliest event, a tuple (time, kind, data)
+        """
+        time, _, kind, data = heapq.heappop(self._heap)
+        return time, kind, data
+
+
+    def __len__(self):
+        """
+        Returns (int) the number of events in the queue
+        """
+        return len(self._heap)
+
+
+def robot_events(robots):
+    """
+    Generates, in time order, the events of the runs of the robots in
+    `robots`: tuples (time, kind, robot, segment), with kind 'depart' and
+    'arrive' at the start and end of a travel segment and 'pick_start' and
+    'pick_end' at the start and end of a pick segment of the robot's
+    timeline.  Only one event per robot is in the queue at a time.
+
+    Parameter robots: (list) list of `Robot` references
+    """
+    queue = EventQueue()
+    for robot in robots:
+        segments = robot.get_timeline().segments
+        if segments:
+            queue.push(segments[0].period.left, 'start', (robot, 0))
+    while queue:
+        time, edge, (robot, k) = queue.pop()
+        segments = robot.get_timeline().segments
+        segment = segments[k]
+        if segment.item is None:
+            kind = 'depart' if edge == 'start' else 'arrive'
+        else:
+            kind = 'pick_start' if edge == 'start' else 'pick_end'
+        yield time, kind, robot, segment
+        #next event of this robot: the end of the segment, then the start
+        #of the next segment
+        if edge == 'start':
+            queue.push(segment.period.right, 'end', (robot, k))
+        elif k + 1 < len(segments):
+            queue.push(segments[k + 1].period.left, 'start', (robot, k + 1))
+
+
+def dispatch_allocation(robots, items):
+    """
+    Allocate item pickups to robots by simulating the robots in time order.
+
+    Parameters
+        ----------
+        robots : list
+            non-empty list of unique `Robot` references
+        items : list
+            non-empty list of unique `Item` references
+
+    Algorithm:  Each robot has a 'free' event at the time of its most recent
+    location.  The earliest free robot picks the item left that minimizes
+    the objective 0.8*time_needed + 0.2*time_ratio of `create_allocation`
+    (the first such item on ties) and is free again when the pickup ends.
+    A robot that can pick no item left is done.  The simulation ends when
+    no robot is free or no item is left.
+
+    Returns
+    -------
+    lisR : list
+        list of the `Robot`s that picked up `Item`s
+    lisI : list
+        list of remaining `Item`s that didn't get picked up
+    """
+    lisR = []
+    in_lisR = set()  # indices of the robots in lisR
+    shared = Fleet.attached(robots)
+    fleet = Fleet.of(robots)
+    try:
+        columns = item_columns(items)
+        queue = EventQueue()
+        for k in range(len(fleet)):
+            queue.push(fleet.time[k], 'free', k)
+        while queue and columns['free'].any():
+            _, _, k = queue.pop()
+            cost, feasible = fleet.cost_matrix(columns, rows=[k])
+            if not feasible.any():
+                continue
+            cost[~feasible] = float('inf')
+            j = int(cost[0].argmin())
+            robot = fleet[k]
+            robot.pick(items[j])
+            columns['free'][j] = False
+            if k not in in_lisR:
+                in_lisR.add(k)
+                lisR.append(robot)
+            queue.push(fleet.time[k], 'free', k)
+        return lisR, [items[j] for j in range(len(items))
+                      if columns['free'][j]]
+    finally:
+        if fleet is not shared:
+            fleet.release()
@@ -0,0 +1,197 @@
+# spatial_index.py
+"""
+Uniform grid of robot locations, used to find the robots near an item
+without looking at every robot.
+
+The room is divided into square cells of side `cell_size`.  Each robot is
+filed in the cell of its current location (the location given by
+`where_am_i`).  A search from an item's location visits the cells in rings
+of increasing distance, so the nearest robots come first, and stops as soon
+as no robot in the rings that are left can be better than the best one
+found so far.  Robots with no time left are dropped from the grid, and a
+ring is only visited inside the range of the cells that hold robots, which
+is kept up to date as robots move.
+"""
+
+import heapq
+import math
+
+
+def travel_lower_bound(robot, loc):
+    """
+    Returns (float) a lower bound on the number of time steps `robot` needs
+    to travel from its current location to `loc`: the straight line distance
+    divided by the distance the robot can move in one time step.
+    """
+    here, _ = robot.where_am_i()
+    dist = math.hypot(loc[0] - here[0], loc[1] - here[1])
+    return max(dist/robot.get_speed() - 1e-9, 0)
+
+
+class RobotGrid:
+    """
+    A RobotGrid files robots by the grid cell of their current location.
+    Robots with no time left are dropped from the grid.
+
+    Attributes
+    ----------
+    cell_size : float
+        side length of a (square) grid cell
+    robots : list
+        the robots in the grid, in the order given
+    max_speed : number
+        the largest `get_speed()` of the robots
+    max_payload : number
+        the largest `get_payload()` of the robots
+    max_arms : int
+        the largest `get_num_arms()` of the robots
+    """
+
+    def __init__(self, robots, cell_size=None, indices=None):
+        """
+        Initializes a RobotGrid with the robots in the list `robots`
+
+        Parameters
+        ----------
+        robots : list
+            non-empty list of unique `Robot` references
+        cell_size : float
+            side length of a grid cell.  Default: None, a size that gives
+            about one robot per cell over the area the robots are in.
+        indices : list
+            non-empty list of the indices of the robots to file in the grid
+            (e.g., the robots of one speed).  Default: None, all of them.
+        """
+        if indices is None:
+            indices = range(len(robots))
+        self.robots = robots
+        self.max_speed = max(robots[k].get_speed() for k in indices)
+        self.max_payload = max(robots[k].get_payload() for k in indices)
+        self.max_arms = max(robots[k].get_num_arms() for k in indices)
+        if cell_size is None:
+            locs = [robots[k].where_am_i()[0] for k in indices]
+            width = max(l[0] for l in locs) - min(l[0] for l in locs)
+            height = max(l[1] for l in locs) - min(l[1] for l in locs)
+            cell_size = max(math.sqrt((width + 1)*(height + 1)/len(locs)), 1)
+        self.cell_size = cell_size
+        self._cells = {}  # cell (i, j) -> list of robot indices
+        self._cell_of = [None]*len(robots)  # robot index -> cell, or None
+        self._bounds = None  # [imin, imax, jmin, jmax] of the cells in use
+        self._time_left = []  # heap of (-time left, k) as robots are filed
+        for k in indices:
+            self.move(k)
+
+
+    def _cell(self, loc):
+        """
+        Returns the tuple (i, j) of the grid cell that contains `loc`
+        """
+        return (math.floor(loc[0]/self.cell_size),
+                math.floor(loc[1]/self.cell_size))
+
+
+    def move(self, k):
+        """
+        Files robot `robots[k]` (one of the indices of the grid) again after
+        its location has changed, e.g., after it picked an item.  A robot
+        with no time left is dropped from the grid, so that searches no
+        longer visit it.
+        """
+        loc, t = self.robots[k].where_am_i()
+        time_left = self.robots[k].get_total_time() - t
+        cell = None
+        if time_left > 0:
+            cell = self._cell(loc)
+            heapq.heappush(self._time_left, (-time_left, k))
+        old = self._cell_of[k]
+        if cell == old:
+            return
+        if old is not None:
+            self._cells[old].remove(k)
+            if not self._cells[old]:
+                del self._cells[old]
+                #the bounds are found again if a cell on them was emptied
+                b = self._bounds
+                if b is not None and (old[0] in b[:2] or old[1] in b[2:]):
+                    self._bounds = None
+        if cell is not None:
+            if cell not in self._cells:
+                self._cells[cell] = []
+                if self._bounds is not None:
+                    b = self._bounds
+                    self._bounds = [min(b[0], cell[0]), max(b[1], cell[0]),
+                                    min(b[2], cell[1]), max(b[3], cell[1])]
+            self._cells[cell].append(k)
+        self._cell_of[k] = cell
+
+
+    def robot_indices(self):
+        """
+        Returns the list of the indices of the robots in the grid
+        """
+        return [k for ks in self._cells.values() for k in ks]
+
+
+    def max_time_left(self):
+        """
+        Returns the largest time left of the robots in the grid (0 if the
+        grid is empty).  Entries of robots that moved since are dropped
+        from the heap as they come to the top.
+        """
+        while self._time_left:
+            time_left, k = self._time_left[0]
+            r = self.robots[k]
+            if (self._cell_of[k] is not None
+                    and r.get_total_time() - r.where_am_i()[1] == -time_left):
+                return -time_left
+            heapq.heappop(self._time_left)
+        return 0
+
+
+    def _get_bounds(self):
+        """
+        Returns [imin, imax, jmin, jmax], the range of the cells that hold
+        robots, found again only after a cell on them was emptied
+        """
+        if self._bounds is None:
+            rows = [i for i, _ in self._cells]
+            cols = [j for _, j in self._cells]
+            self._bounds = [min(rows), max(rows), min(cols), max(cols)]
+        return self._bounds
+
+
+    def rings(self, loc):
+        """
+        Generates, nearest first, the tuples (ring, indices): `indices` is
+        the list of the indices of the robots whose cells are `ring` cells
+        away from the cell of `loc` (in the x or y direction, whichever is
+        farther).  Every robot in ring k is at least (k-1)*cell_size away
+        from `loc`.  Ends after the last ring that reaches a cell in use.
+        Robots with no time left are not in the grid.
+        """
+        ci, cj = self._cell(loc)
+        if not self._cells:
+            return
+        imin, imax, jmin, jmax = self._get_bounds()
+        last = max(ci - imin, imax - ci, cj - jmin, jmax - cj, 0)
+        for k in range(last + 1):
+            indices = []
+            if k == 0:
+                indices.extend(self._cells.get((ci, cj), []))
+            else:
+                #only the part of the ring inside the bounds can hold robots
+                for i in range(max(ci - k, imin), min(ci + k, imax) + 1):
+                    indices.extend(self._cells.get((i, cj - k), []))
+                    indices.extend(self._cells.get((i, cj + k), []))
+                for j in range(max(cj - k + 1, jmin), min(cj + k, jmax + 1)):
+                    indices.extend(self._cells.get((ci - k, j), []))
+                    indices.extend(self._cells.get((ci + k, j), []))
+            yield k, indices
+
+
+    def ring_lower_bound(self, k):
+        """
+        Returns (float) a lower bound on the travel time from an item's
+        location to any robot in ring k of the search from that location
+        """
+        return max(k - 1, 0)*self.cell_size/self.max_speed
@@ -0,0 +1,185 @@
+# timeline.py
+"""
+Segment-based timelines of robot locations
+
+A robot's run is a sequence of segments: a travel segment moves the robot in
+a straight line from one location to another at a fixed speed, and a pick
+segment keeps it at an item's location.  The location at any time step is
+computed on demand from the segment that covers that time step, so a
+timeline takes memory for each task the robot does, not for each time step.
+"""
+
+import bisect
+import numpy as np
+from interval import Interval
+
+
+class Segment:
+    """
+    A Segment is a part of a robot's run over the time steps of an Interval.
+
+    Attributes
+    ----------
+    period : Interval
+        the time steps of the segment: the robot is at `start_loc` at time
+        period.left and at `end_loc` at time period.right
+    start_loc : numpy array
+        length 2 location at time period.left
+    end_loc : numpy array
+        length 2 location at time period.right
+    speed : number
+        distance moved in each time step, with a shorter last step if needed.
+        0 for a segment that does not move.
+    item : Item or None
+        the item picked during the segment, None for a travel segment
+    """
+
+    def __init__(self, period, start_loc, end_loc, speed=0, item=None):
+        """
+        Initializes a Segment object
+
+        Parameters
+        ----------
+        period : an `Interval` of time steps, with integer endpoints
+        start_loc : length 2 list (or array) of x-y coordinates
+        end_loc : length 2 list (or array) of x-y coordinates
+        speed : distance moved in each time step.  Default: 0
+        item : the `Item` picked during the segment.  Default: None
+        """
+        self.period = period
+        self.start_loc = np.asarray(start_loc, dtype=float)
+        self.end_loc = np.asarray(end_loc, dtype=float)
+        self.speed = speed
+        self.item = item
+        delta = self.end_loc - self.start_loc
+        self._length = float(np.hypot(delta[0], delta[1]))
+        self._unit = delta/self._length if self._length > 0 else delta
+
+
+    def positions(self, times):
+        """
+        Returns a len(times)-by-2 array of the locations at the time steps in
+        `times`, which must be in the period of the segment.  The location
+        is exactly `end_loc` at the end of the segment.
+
+        Parameter times: a 1-d int array of time steps
+        """
+        times = np.asarray(times)
+        along = np.minimum((times - self.period.left)*self.speed,
+                           self._length)
+        pos = self.start_loc + along[:, None]*self._unit
+        pos[times >= self.period.right] = self.end_loc
+        return pos
+
+
+class Timeline:
+    """
+    A Timeline is the run of a robot: its starting location at a starting
+    time, followed by contiguous `Segment`s.
+
+    Attributes
+    ----------
+    start_time : int
+        the first time step of the run
+    segments : list
+        the `Segment`s of the run, in time order.  Each segment starts at the
+        time the one before it ends.
+    end_time : int
+        the time step at the end of the last segment (start_time if there is
+        no segment)
+    end_loc : numpy array
+        the length 2 location at end_time
+    """
+
+    def __init__(self, start_loc, start_time=1):
+        """
+        Initializes a Timeline with no segments
+
+        Parameters
+        ----------
+        start_loc : length 2 list of the x-y coordinates at start_time
+        start_time : (int) the first time step.  Default: 1
+        """
+        self.start_time = start_time
+        self.segments = []
+        self._starts = []  # period.left of each segment, for bisect
+        self.end_time = start_time
+        self.end_loc = np.asarray(start_loc, dtype=float)
+
+
+    def add_travel(self, num_steps, end_loc, speed):
+        """
+        Appends a travel segment of num_steps time steps from `end_loc` of
+        self to `end_loc`.  Does nothing if num_steps is 0.
+        """
+        if num_steps > 0:
+            self._append(Segment(Interval(self.end_time,
+                                          self.end_time + num_steps),
+                                 self.end_loc, end_loc, speed))
+
+
+    def add_pick(self, duration, item):
+        """
+        Appends a pick segment of `duration` time steps at the current
+        `end_loc` of self.  Does nothing if duration is 0.
+        """
+        if duration > 0:
+            self._append(Segment(Interval(self.end_time,
+                                          self.end_time + duration),
+                                 self.end_loc, self.end_loc, 0, item))
+
+
+    def _append(self, segment):
+        """
+        Appends `segment`, which starts at end_time, to self
+        """
+        self.segments.append(segment)
+        self._starts.append(segment.period.left)
+        self.end_time = segment.period.right
+        self.end_loc = segment.end_loc
+
+
+    def position_at(self, t):
+        """
+        Returns a length 2 array: the location at time step t.  Before
+        start_time it is the starting location; after end_time it is end_loc.
+
+        Parameter t: (int) a time step
+        """
+        return self.positions(np.array([t]))[0]
+
+
+    def positions(self, times):
+        """
+        Returns a len(times)-by-2 array of the locations at the time steps in
+        `times`, as position_at would give them
+
+        Parameter times: a 1-d int array of time steps
+        """
+        times = np.asarray(times)
+        pos = np.empty((len(times), 2))
+        if not self.segments:
+            pos[:] = self.end_loc
+            return pos
+        pos[times <= self.start_time] = self.segments[0].start_loc
+        pos[times >= self.end_time] = self.end_loc
+        inside = np.flatnonzero((times > self.start_time)
+                                & (times < self.end_time))
+        #index of the segment covering each time step
+        which = np.searchsorted(self._starts, times[inside], side='right') - 1
+        for k in np.unique(which):
+            sel = inside[which == k]
+            pos[sel] = self.segments[k].positions(times[sel])
+        return pos
+
+
+    def segment_at(self, t):
+        """
+        Returns the `Segment` that covers time step t (the later one if t is
+        where one segment ends and the next starts), or None if t is not in
+        any segment
+        """
+        k = bisect.bisect_right(self._starts, t) - 1
+        if k < 0 or t > self.segments[k].period.right:
+            return None
+        return self.segments[k]
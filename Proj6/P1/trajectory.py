@@ -0,0 +1,157 @@
+# trajectory.py
+"""
+Time-indexed store of the trajectories of a fleet of robots
+
+"Where is every robot at time t" used to be asked one robot at a time
+(`Robot.draw(t)`, with `where_am_i` to hold a robot at its final location).
+Trajectories packs the `Timeline`s of all the robots into one segment table
+(parallel arrays, one row per segment of every robot), from which the
+locations of all the robots at any time steps are computed in one
+vectorized pass, and optionally into a dense num_robots-by-sim_time-by-2
+array of locations, from which they are plain slices.  The pickup status of
+every item at a time step is a vectorized comparison too.
+"""
+
+import numpy as np
+
+# item pickup status codes returned by Trajectories.item_status
+WAITING = 0  # not scheduled, or the robot has not reached it yet
+PICKING = 1  # the robot is picking it up
+PICKED = 2  # fully picked up
+
+
+class Trajectories:
+    """
+    Trajectories holds the runs of a list of robots and the pickup windows
+    of a list of items.
+
+    Attributes
+    ----------
+    sim_time : int
+        number of time steps, 1 to sim_time
+    start_loc : num_robots-by-2 array of the robots' locations at time 1
+    segments : dict
+        the segment table, rows sorted by robot then time:
+        'robot' (index of the robot), 'start' and 'end' (period of the
+        segment), 'start_loc' and 'end_loc' (n-by-2), 'speed', 'length'
+        (distance from start_loc to end_loc) and 'item' (index of the item
+        picked, -1 for a travel segment or an item not in the list)
+    positions : num_robots-by-sim_time-by-2 array, or None
+        element [k, t-1] is the location of robot k at time step t
+    pickup_start, pickup_end : float arrays
+        the picked_window of each item (inf if not scheduled)
+    """
+
+    def __init__(self, robots, items, sim_time, dense=True):
+        """
+        Builds the Trajectories of `robots` (list of `Robot` references) and
+        `items` (list of `Item` references) over time steps 1 to sim_time.
+        If `dense` is True (default), the dense `positions` array is built
+        too; otherwise locations are computed from the segment table.
+        """
+        self.sim_time = sim_time
+        item_index = {id(items[j]): j for j in range(len(items))}
+        self.start_loc = np.zeros((len(robots), 2))
+        rows = []
+        for k in range(len(robots)):
+            timeline = robots[k].get_timeline()
+            if timeline.segments:
+                self.start_loc[k] = timeline.segments[0].start_loc
+            else:
+                self.start_loc[k] = timeline.end_loc
+            for s in timeline.segments:
+                rows.append((k, s.period.left, s.period.right,
+                             s.start_loc[0], s.start_loc[1],
+                             s.end_loc[0], s.end_loc[1], s.speed,
+                             item_index.get(id(s.item), -1)))
+        table = np.array(rows, dtype=float).reshape(-1, 9)
+        delta = table[:, 5:7] - table[:, 3:5]
+        self.segments = {'robot': table[:, 0].astype(np.int64),
+                         'start': table[:, 1].astype(np.int64),
+                         'end': table[:, 2].astype(np.int64),
+                         'start_loc': table[:, 3:5],
+                         'end_loc': table[:, 5:7],
+                         'speed': table[:, 7],
+                         'length': np.hypot(delta[:, 0], delta[:, 1]),
+                         'item': table[:, 8].astype(np.int64)}
+
+        windows = [i.picked_window for i in items]
+        self.pickup_start = np.array([np.inf if w is None else w.left
+                                      for w in windows], dtype=float)
+        self.pickup_end = np.array([np.inf if w is None else w.right
+                                    for w in windows], dtype=float)
+
+        self.positions = None
+        if dense:
+            self.positions = self.locations(np.arange(1, sim_time + 1))
+
+
+    def __len__(self):
+        return len(self.start_loc)
+
+
+    def locations(self, times):
+        """
+        Returns a num_robots-by-len(times)-by-2 array of the locations of
+        all the robots at the time steps in `times`, computed from the
+        segment table (a robot stays at its last location after its run)
+
+        Parameter times: a 1-d int array of time steps
+        """
+        times = np.asarray(times, dtype=np.int64)
+        seg = self.segments
+        num_robots = len(self)
+        pos = np.broadcast_to(self.start_loc[:, None],
+                              (num_robots, len(times), 2)).copy()
+        if len(seg['robot']) == 0 or len(times) == 0:
+            return pos
+        #index of the last segment of robot k that starts before time t
+        span = max(int(seg['end'].max()), int(times.max())) + 1
+        keys = seg['robot']*span + seg['start']
+        robot = np.repeat(np.arange(num_robots), len(times))
+        t = np.tile(times, num_robots)
+        which = np.searchsorted(keys, robot*span + t, side='right') - 1
+        found = (which >= 0)
+        found[found] = seg['robot'][which[found]] == robot[found]
+        which = which[found]
+        t = t[found]
+        #along the segment, or at its end once it is over
+        along = np.minimum((t - seg['start'][which])*seg['speed'][which],
+                           seg['length'][which])
+        length = np.where(seg['length'][which] > 0, seg['length'][which], 1)
+        start = seg['start_loc'][which]
+        unit = (seg['end_loc'][which] - start)/length[:, None]
+        loc = start + along[:, None]*unit
+        over = t >= seg['end'][which]
+        loc[over] = seg['end_loc'][which[over]]
+        pos.reshape(-1, 2)[found] = loc
+        return pos
+
+
+    def positions_at(self, t):
+        """
+        Returns the num_robots-by-2 array of the locations of all the robots
+        at time step t
+        """
+        if self.positions is not None and 1 <= t <= self.sim_time:
+            return self.positions[:, t - 1]
+        return self.locations([t])[:, 0]
+
+
+    def positions_between(self, t1, t2):
+        """
+        Returns the num_robots-by-(t2-t1+1)-by-2 array of the locations of
+        all the robots at time steps t1 to t2 (inclusive)
+        """
+        if self.positions is not None and 1 <= t1 and t2 <= self.sim_time:
+            return self.positions[:, t1 - 1:t2]
+        return self.locations(np.arange(t1, t2 + 1))
+
+
+    def item_status(self, t):
+        """
+        Returns an int array of the pickup status of every item at time step
+        t: WAITING, PICKING or PICKED
+        """
+        return np.where(t >= self.pickup_end, PICKED,
+                        np.where(t >= self.pickup_start, PICKING, WAITING))
@@ -0,0 +1,153 @@
+# whatif.py
+"""
+Parallel what-if runs of the Project 6 robot task allocation
+
+Runs an allocation algorithm over many scenarios (room files, .npz scenario
+files or generated `Scenario`s) and random seeds, spread over a pool of
+worker processes, without any graphics.  Each run seeds np.random with its
+own seed before the robots are created, so the random default multipliers
+of FastRobot and LimbedRobot, and hence the whole run, can be reproduced.
+"""
+
+import numpy as np
+import os
+import time
+from multiprocessing import Pool
+from robot import Robot, FastRobot, LimbedRobot
+from item import Item
+from scenario import (Scenario, load_scenario, create_objects,
+                      DEFAULT_PAYLOAD)
+from main6 import (simple_allocation, create_allocation,
+                   create_allocation_indexed)
+from assignment import assignment_allocation
+from scheduler import dispatch_allocation
+from best_first import best_first_allocation
+
+# allocation algorithms by name (names, not functions, are sent to workers)
+ALLOCATORS = {f.__name__: f for f in [simple_allocation, create_allocation,
+                                      create_allocation_indexed,
+                                      assignment_allocation,
+                                      dispatch_allocation,
+                                      best_first_allocation]}
+
+
+def generate_scenario(num_robots, num_items, sim_time, size, rng):
+    """
+    Returns a random `Scenario` in a size-by-size room: num_robots robots
+    (Robot, FastRobot and LimbedRobot in turn) and num_items items.  The
+    FastRobots' speeds and the LimbedRobots' payload factors are left to
+    their random defaults, drawn when the robots are created.
+
+    Parameter rng: a numpy.random.Generator
+    """
+    kind = np.arange(num_robots) % 3
+    robots = {'kind': kind,
+              'id': np.arange(1, num_robots + 1),
+              'max_weight': rng.integers(1, 10, num_robots).astype(float),
+              'x': rng.integers(0, size, num_robots),
+              'y': rng.integers(0, size, num_robots),
+              'speed': np.where(kind == 2,
+                                rng.choice([0.25, 0.5, 0.75], num_robots),
+                                np.nan),
+              'max_payload': np.where(kind == 2, DEFAULT_PAYLOAD, 0),
+              'num_arms': np.where(kind == 2,
+                                   rng.integers(0, 4, num_robots), 0)}
+    items = {'id': np.arange(1, num_items + 1),
+             'name': np.array([f'item{k}' for k in range(1, num_items + 1)]),
+             'weight': rng.integers(1, 40, num_items).astype(float),
+             'arms': rng.integers(0, 3, num_items),
+             'x': rng.integers(0, size, num_items),
+             'y': rng.integers(0, size, num_items),
+             'duration': rng.integers(1, 5, num_items)}
+    return Scenario(sim_time, [size, size], robots, items)
+
+
+def summarize(robots, items):
+    """
+    Returns a dict of the results of an allocation:
+        'num_items' : number of items
+        'items_served' : number of items picked up
+        'makespan' : time at which the last pickup ends (0 if none)
+        'robot_ids' : int array of the ids of the robots
+        'utilization' : float array, for each robot the fraction of its
+            time (from time 1 to its total time) in `_occupied_periods`
+    """
+    windows = [item.picked_window for item in items
+               if item.picked_window is not None]
+    utilization = np.zeros(len(robots))
+    for k in range(len(robots)):
+        busy = sum(p.get_width() for p in robots[k].get_occupied_periods())
+        utilization[k] = busy/max(robots[k].get_total_time() - 1, 1)
+    return {'num_items': len(items),
+            'items_served': len(windows),
+            'makespan': max([w.right for w in windows], default=0),
+            'robot_ids': np.array([r.get_id() for r in robots]),
+            'utilization': utilization}
+
+
+def run_scenario(task):
+    """
+    Runs one allocation and returns its results (see summarize), with the
+    keys 'scenario', 'seed', 'allocator' and 'seconds' added.
+
+    Parameter task: a tuple (label, scenario, seed, allocator): scenario is a
+        `Scenario` or the name of a file for load_scenario, seed is the seed
+        for np.random, allocator is a key of ALLOCATORS
+    """
+    label, scenario, seed, allocator = task
+    np.random.seed(seed)
+    if isinstance(scenario, str):
+        scenario = load_scenario(scenario)
+    robots, items = create_objects(scenario, Robot, Item, FastRobot,
+                                   LimbedRobot)
+    tstart = time.time()
+    ALLOCATORS[allocator](robots, items)
+    results = summarize(robots, items)
+    results.update({'scenario': label, 'seed': seed, 'allocator': allocator,
+                    'seconds': time.time() - tstart})
+    return results
+
+
+def run_whatif(scenarios, seeds, allocator='create_allocation', workers=None):
+    """
+    Runs `allocator` on every scenario with every seed, over a pool of
+    worker processes, and returns the list of the results (see
+    run_scenario), scenario by scenario and seed by seed
+
+    Parameters
+    ----------
+    scenarios : list of `Scenario`s and/or file names
+    seeds : list of int seeds
+    allocator : (str) a key of ALLOCATORS.  Default: 'create_allocation'
+    workers : number of worker processes.  Default: None, one per core
+    """
+    tasks = [(s if isinstance(s, str) else k, s, seed, allocator)
+             for k, s in enumerate(scenarios) for seed in seeds]
+    with Pool(workers) as pool:
+        return pool.map(run_scenario, tasks)
+
+
+if __name__ == "__main__":
+    # Fleet sizing: the same 300 items with more and more robots
+    rng = np.random.default_rng(1112)
+    fleet_sizes = [5, 10, 20, 40, 80]
+    scenarios = [generate_scenario(n, 300, 400, 60, rng) for n in fleet_sizes]
+    seeds = list(range(8))
+
+    tstart = time.time()
+    results = run_whatif(scenarios, seeds)
+    print(f'{len(results)} runs on {os.cpu_count()} cores in',
+          f'{time.time() - tstart:.2f} s')
+
+    # Runs are reproducible: the same seed gives the same results
+    again = run_scenario((0, scenarios[0], seeds[0], 'create_allocation'))
+    assert np.array_equal(again['utilization'], results[0]['utilization'])
+
+    print(' robots  items served  makespan  mean utilization')
+    for b in range(len(fleet_sizes)):
+        runs = results[b*len(seeds):(b + 1)*len(seeds)]
+        served = np.mean([r['items_served'] for r in runs])
+        makespan = np.mean([r['makespan'] for r in runs])
+        utilization = np.mean([r['utilization'].mean() for r in runs])
+        print(f'{fleet_sizes[b]:7d}  {served:12.1f}  {makespan:8.1f}',
+              f' {utilization:16.3f}')